@@ -2,6 +2,9 @@ from mcp.server.fastmcp import FastMCP
 import numpy as np
 import json
 
+# Outlier detection methods accepted by find_outliers
+_OUTLIER_METHODS = frozenset({"zscore", "iqr"})
+
 # MPC server instance name "DataAnalysis"
 mcp = FastMCP("DataAnalysis")
 
@@ -74,11 +77,15 @@ def find_outliers(data: list, method: str = "zscore") -> str:
         Indices and values of outliers
     """
     try:
+        method_name = method.lower()
+        if method_name not in _OUTLIER_METHODS:
+            return f"Error: Unknown method '{method}'. Use 'zscore' or 'iqr'."
+
         arr = np.array(data, dtype=float)
         outliers = []
         outlier_indices = []
         
-        if method.lower() == "zscore":
+        if method_name == "zscore":
             # Z-score method (values more than 2.5 standard deviations away)
             mean = np.mean(arr)
             std = np.std(arr)
@@ -90,7 +97,7 @@ def find_outliers(data: list, method: str = "zscore") -> str:
                     outliers.append(float(value))
                     outlier_indices.append(i)
                     
-        elif method.lower() == "iqr":
+        else:
             # IQR method
             q1 = np.percentile(arr, 25)
             q3 = np.percentile(arr, 75)
@@ -102,8 +109,6 @@ def find_outliers(data: list, method: str = "zscore") -> str:
                 if value < lower_bound or value > upper_bound:
                     outliers.append(float(value))
                     outlier_indices.append(i)
-        else:
-            return f"Error: Unknown method '{method}'. Use 'zscore' or 'iqr'."
             
         result = {
             "outlier_count": len(outliers),
@@ -2,6 +2,37 @@ from mcp.server.fastmcp import FastMCP
 import math
 from typing import List
 
+import numpy as np
+
+# Lists at least this long are reduced with the parallel Numba kernels when
+# Numba is installed; below it, thread start-up costs more than it saves
+PARALLEL_THRESHOLD = 1_000_000
+
+try:
+    from numba import njit, prange
+
+    @njit(cache=True, parallel=True)
+    def _parallel_sum(a):
+        s = 0.0
+        for i in prange(a.shape[0]):
+            s += a[i]
+        return s
+
+    @njit(cache=True, parallel=True)
+    def _parallel_max(a):
+        m = a[0]
+        # Written as m = max(m, ...) so Numba recognizes the parallel reduction
+        for i in prange(1, a.shape[0]):
+            m = max(m, a[i])
+        return m
+
+    # Compile now so the first large request does not pay for the JIT
+    _parallel_sum(np.zeros(1))
+    _parallel_max(np.zeros(1))
+except Exception:  # Numba missing or unable to compile here
+    _parallel_sum = None
+    _parallel_max = None
+
 # MCP server instance name "Math"
 mcp = FastMCP("math_server")
 
@@ -51,16 +82,22 @@ def square_root(a: int) -> float:
 @mcp.tool()
 def mean(numbers: List[float]) -> float:
     """Calculate the mean (average) of a list of numbers."""
-    if not numbers:
+    arr = np.asarray(numbers, dtype=np.float64)
+    if arr.size == 0:
         raise ValueError("List cannot be empty.")
-    return sum(numbers) / len(numbers)
+    if _parallel_sum is not None and arr.size >= PARALLEL_THRESHOLD:
+        return float(_parallel_sum(arr) / arr.size)
+    return float(arr.mean())
 
 @mcp.tool()
 def max_value(numbers: List[float]) -> float:
     """Find the maximum value in a list of numbers."""
-    if not numbers:
+    arr = np.asarray(numbers, dtype=np.float64)
+    if arr.size == 0:
         raise ValueError("List cannot be empty.")
-    return max(numbers)
+    if _parallel_max is not None and arr.size >= PARALLEL_THRESHOLD:
+        return float(_parallel_max(arr))
+    return float(arr.max())
 
 # Run the MCP server
 if __name__ == '__main__':
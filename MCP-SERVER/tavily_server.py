@@ -1,30 +1,73 @@
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from typing import List
+import json
 import os
 
+from cachetools import TTLCache
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library
+    orjson = None
+
 load_dotenv()
 
 TAVILY_API_KEY = os.getenv('TAVILY_API_KEY')
 
-client = TavilyClient(TAVILY_API_KEY)
+# Async client so concurrent tool calls wait on Tavily at the same time
+client = AsyncTavilyClient(TAVILY_API_KEY)
 
 mcp = FastMCP('web search')
 
+# Recent search results, keyed by query. Weather and exchange rates go stale
+# quickly, so they are kept for a minute; news for five minutes.
+_weather_cache = TTLCache(maxsize=1024, ttl=60)
+_football_news_cache = TTLCache(maxsize=1024, ttl=300)
+_forex_cache = TTLCache(maxsize=1024, ttl=60)
+
+# Set TAVILY_CACHE=off to send every search to Tavily
+CACHE_ENABLED = os.getenv('TAVILY_CACHE', 'on').strip().lower() != 'off'
+
+
+def _dumps(response):
+    """Serialize a search response to a JSON string, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(response, default=str).decode()
+    return json.dumps(response, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+async def _cached_search(cache, request):
+    """
+    Search Tavily for request, reusing a cached result unless caching is turned off.
+    Only successful searches are cached.
+    """
+    # The caches are only touched from the event loop thread, so need no lock
+    if CACHE_ENABLED:
+        cached = cache.get(request)
+        if cached is not None:
+            return cached
+    
+    response = await client.search(
+        query=request
+    )
+    response_str = _dumps(response)
+    
+    response_str = response_str.replace('\u2014', '-')
+    
+    if CACHE_ENABLED:
+        cache[request] = response_str
+    return response_str
+
 # operatios
 
 @mcp.tool()
-def get_weather(request:str) -> str:
+async def get_weather(request:str) -> str:
     
     print(request)
     try:
-        response = client.search(
-            query=request
-        )
-        response_str = str(response)
-        
-        response_str = response_str.replace('\u2014', '-')
+        response_str = await _cached_search(_weather_cache, request)
         
         print("response")
         return response_str
@@ -32,16 +75,11 @@ def get_weather(request:str) -> str:
         return f"Unable to process weather data for {request} due to encoding issues. Please try another location."
 
 @mcp.tool()
-def get_football_news(request:str) -> str:
+async def get_football_news(request:str) -> str:
     
     print(request)
     try:
-        response = client.search(
-            query=request
-        )
-        response_str = str(response)
-        
-        response_str = response_str.replace('\u2014', '-')
+        response_str = await _cached_search(_football_news_cache, request)
         
         print("response")
         return response_str
@@ -49,16 +87,11 @@ def get_football_news(request:str) -> str:
         return f"Unable to process foot ball news: {request} due to encoding issues. Please try another location."
 
 @mcp.tool()
-def get_forex_updates(request:str) -> str:
+async def get_forex_updates(request:str) -> str:
     
     print(request)
     try:
-        response = client.search(
-            query=request
-        )
-        response_str = str(response)
-        
-        response_str = response_str.replace('\u2014', '-')
+        response_str = await _cached_search(_forex_cache, request)
         
         print("response")
         return response_str
@@ -17,6 +17,9 @@ LANGUAGE_CODES = {
     "arabic": "ar"
 }
 
+# Listed in the unsupported-language error; built once rather than on every failed call
+_SUPPORTED_LANGUAGES_TEXT = ", ".join(LANGUAGE_CODES)
+
 # Basic translations for common phrases (in a real implementation, this would use a translation API)
 TRANSLATIONS = {
     "hello": {
@@ -88,7 +91,7 @@ def translate(text: str, target_language: str) -> str:
     # Get the language code
     lang_code = LANGUAGE_CODES.get(target_language)
     if not lang_code:
-        return f"Error: Unsupported language '{target_language}'. Supported languages are: {', '.join(LANGUAGE_CODES.keys())}"
+        return f"Error: Unsupported language '{target_language}'. Supported languages are: {_SUPPORTED_LANGUAGES_TEXT}"
     
     # Simple translation for demonstration purposes
     # In a real implementation, this would use a translation API
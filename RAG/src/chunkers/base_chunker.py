@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 
-from ..readers.schema import Document, DocumentChunk
+from ..readers.schema import Document, DocumentChunk, make_chunk_id
 from ..utils.logger import logger
 from ..utils.error_handler import ChunkingError, error_handler
 from ..config.settings import settings
@@ -66,11 +66,17 @@ class BaseChunker(ABC):
         # Call the implementation-specific chunking method
         chunks = self._chunk_document(document, **kwargs)
         
-        # Set document_id and chunk_index for each chunk
+        # Set document_id and chunk_index for each chunk, and the chunk_id derived from them.
+        # Chunks are immutable, so each is replaced by an updated copy.
         document_id = document.metadata.source_id
-        for i, chunk in enumerate(chunks):
-            chunk.document_id = document_id
-            chunk.chunk_index = i
+        chunks = [
+            chunk.model_copy(update={
+                "document_id": document_id,
+                "chunk_index": i,
+                "chunk_id": make_chunk_id(document_id, i)
+            })
+            for i, chunk in enumerate(chunks)
+        ]
         
         self.logger.info(f"Created {len(chunks)} chunks from document: {document.metadata.file_name}")
         return chunks
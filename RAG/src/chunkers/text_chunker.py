@@ -158,12 +158,13 @@ class TextChunker:
                             "chunking_method": self.chunking_method,
                         }
                     else:
-                        document.metadata.chunks_info = {
+                        # FileMetadata is immutable; attach an updated copy
+                        document.metadata = document.metadata.model_copy(update={"chunks_info": {
                             "count": len(chunks),
                             "chunk_size": self.chunk_size,
                             "chunk_overlap": self.chunk_overlap,
                             "chunking_method": self.chunking_method,
-                        }
+                        }})
                 except Exception as e:
                     logger.warning(f"Could not attach chunk metadata: {e}")
 
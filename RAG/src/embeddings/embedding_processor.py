@@ -15,7 +15,7 @@ from langchain.embeddings import (
 from langchain.storage import LocalFileStore
 
 # Import from your existing modules
-from ..readers.schema import Document
+from ..readers.schema import Document, as_embedding_array
 from ..utils.logger import logger
 from ..utils.error_handler import PipelineError
 from ..config.settings import settings  # Ensure this import path matches your project structure
@@ -110,13 +110,13 @@ class EmbeddingProcessor:
         try:
             if not hasattr(document, 'chunks') or not document.chunks:
                 logger.warning(f"Document has no chunks to embed: {document.metadata.file_name}")
-                document.chunk_embeddings = []
+                document.chunk_embeddings = as_embedding_array([])
                 return document
 
             logger.info(f"Embedding {len(document.chunks)} chunks from {document.metadata.file_name}")
             
             # Generate embeddings for all chunks
-            embeddings = self.embeddings.embed_documents(document.chunks)
+            embeddings = as_embedding_array(self.embeddings.embed_documents(document.chunks))
             
             # Attach embeddings to document
             try:
@@ -124,7 +124,7 @@ class EmbeddingProcessor:
             except AttributeError as ae:
                 error_message = (
                     f"'chunk_embeddings' not settable on {type(document).__name__}. "
-                    f"Ensure schema defines: chunk_embeddings: Optional[List[List[float]]] = Field(default=None)"
+                    f"Ensure schema defines: chunk_embeddings: Optional[np.ndarray] = Field(default=None)"
                 )
                 raise PipelineError(error_message, ae)
                 
@@ -133,21 +133,22 @@ class EmbeddingProcessor:
                 embeddings_info = {
                     "model": self.model_name,
                     "type": self.embedding_type,
-                    "count": len(embeddings),
-                    "dimensions": len(embeddings[0]) if embeddings else 0,
+                    "count": embeddings.shape[0],
+                    "dimensions": embeddings.shape[1],
                 }
                 
                 try:
                     if isinstance(document.metadata, dict):
                         document.metadata["embeddings_info"] = embeddings_info
                     else:
-                        document.metadata.embeddings_info = embeddings_info
+                        # FileMetadata is immutable; attach an updated copy
+                        document.metadata = document.metadata.model_copy(update={"embeddings_info": embeddings_info})
                 except Exception as e:
                     logger.warning(f"Could not attach embedding metadata: {e}")
                     
             logger.info(
-                f"Generated {len(embeddings)} embeddings "
-                f"({len(embeddings[0]) if embeddings else 0}-dimensional)"
+                f"Generated {embeddings.shape[0]} embeddings "
+                f"({embeddings.shape[1]}-dimensional)"
             )
             return document
             
@@ -10,7 +10,7 @@ from .utils.logger import logger
 from .utils.error_handler import PipelineError
 from .config.settings import RAW_DATA_DIR, PROCESSED_DATA_DIR, LOGS_DIR
 from .readers.schema import Document
-from .utils.state_manager import StateManager
+from .utils.sqlite_state_manager import SQLiteStateManager
 from .chunkers.text_chunker import TextChunker
 from .embeddings.embedding_processor import EmbeddingProcessor
 
@@ -37,8 +37,12 @@ class DocumentPipeline:
         """
         self.input_dir = Path(input_dir) if input_dir else RAW_DATA_DIR
         self.output_dir = Path(output_dir) if output_dir else PROCESSED_DATA_DIR
-        # Pass the correct path to the state file for StateManager
-        self.state_manager = StateManager(state_file=str(LOGS_DIR / "pipeline_state.json"))
+        # Pass the correct path to the state database for SQLiteStateManager. On first
+        # use it imports the state file of the JSON-backed StateManager used before it.
+        self.state_manager = SQLiteStateManager(
+            state_file=str(LOGS_DIR / "pipeline_state.db"),
+            json_state_file=str(LOGS_DIR / "pipeline_state.json")
+        )
 
         # Ensure directories exist
         self.input_dir.mkdir(parents=True, exist_ok=True)
@@ -355,7 +359,7 @@ class DocumentPipeline:
                 print("Metadata:", document.metadata) # Metadata should now include embeddings_info
                 print(f"Number of chunks: {len(document.chunks) if hasattr(document, 'chunks') and isinstance(document.chunks, list) else 0}")
                 print(f"Number of embeddings: {len(document.chunk_embeddings)}")
-                if document.chunks and document.chunk_embeddings:
+                if document.chunks and len(document.chunk_embeddings):
                     print("\nFirst chunk preview:")
                     print(f"Content: {document.chunks[0][:200]}...")
                     print(f"Embedding (first 5 dim): {document.chunk_embeddings[0][:5]}...")
@@ -368,12 +372,8 @@ class DocumentPipeline:
             embedding_info = {
                 "model": embedder.model_name,
                 "type": embedder.embedding_type,
-                "count": len(document.chunk_embeddings) if hasattr(document, "chunk_embeddings") and isinstance(document.chunk_embeddings, list) else 0,
-                "dimensions": (
-                    len(document.chunk_embeddings[0])
-                    if hasattr(document, "chunk_embeddings") and document.chunk_embeddings and len(document.chunk_embeddings) > 0
-                    else 0
-                )
+                "count": document.chunk_embeddings.shape[0] if getattr(document, "chunk_embeddings", None) is not None else 0,
+                "dimensions": document.chunk_embeddings.shape[1] if getattr(document, "chunk_embeddings", None) is not None else 0
             }
 
 
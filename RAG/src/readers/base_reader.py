@@ -1,14 +1,121 @@
 # src/readers/base_reader.py
 from abc import ABC, abstractmethod
 from datetime import datetime
+import functools
 import hashlib
+import os
+import struct
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, Tuple
+from typing import Any, Callable, Dict, Optional, Union, Tuple
 
 from ..utils.error_handler import ReadError, error_handler
+from ..utils.fast_stat import FastStat, fast_stat
 from ..utils.logger import logger
 from ..config.settings import settings
-from .schema import Document, FileMetadata, TextDocument, PDFDocument, DocxDocument, ExcelDocument, CSVDocument, HTMLDocument, XMLDocument, PPTXDocument
+from .schema import Document, FastFileMetadata, FileMetadata, TextDocument, PDFDocument, DocxDocument, ExcelDocument, CSVDocument, HTMLDocument, XMLDocument, PPTXDocument
+
+
+# Only uniqueness is needed for source IDs, so use the faster BLAKE2b with a
+# 128-bit digest. Copying an initialized hasher skips re-running its setup.
+_HASH_PROTO = hashlib.blake2b(digest_size=16)
+
+
+@functools.lru_cache(maxsize=16384)
+def _sid_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """
+    Hash a (path, mtime, size) triple into a source ID.
+    
+    Cached so that re-ingesting unchanged files does not hash them again.
+    """
+    # Feed each pre-encoded part separately rather than concatenating them first
+    h = _HASH_PROTO.copy()
+    h.update(os.fsencode(path_str))
+    h.update(b"\0")
+    h.update(struct.pack("<qQ", mtime_ns, size))
+    return h.hexdigest()
+
+
+# Document builders used by BaseReader._create_document.
+# Each takes (raw_text, fields, metadata), where fields is the reader's content
+# dict (or an empty dict for plain content), and returns a Document.
+
+def _build_text(raw_text: str, fields: Dict[str, Any], metadata: FastFileMetadata) -> Document:
+    return TextDocument.from_trusted(content=raw_text, metadata=metadata)
+
+
+def _build_pdf(raw_text: str, fields: Dict[str, Any], metadata: FastFileMetadata) -> Document:
+    return PDFDocument.from_trusted(content=raw_text, page_texts=fields.get("page_texts"), metadata=metadata)
+
+
+def _build_docx(raw_text: str, fields: Dict[str, Any], metadata: FastFileMetadata) -> Document:
+    return DocxDocument.from_trusted(
+        content=raw_text,
+        paragraphs=fields.get("paragraphs"),
+        tables=fields.get("tables"),
+        metadata=metadata
+    )
+
+
+def _build_excel(raw_text: str, fields: Dict[str, Any], metadata: FastFileMetadata) -> Document:
+    return ExcelDocument.from_trusted(
+        content=raw_text,
+        sheets=fields.get("sheets", {}),
+        sheet_names=fields.get("sheet_names", []),
+        metadata=metadata
+    )
+
+
+def _build_csv(raw_text: str, fields: Dict[str, Any], metadata: FastFileMetadata) -> Document:
+    return CSVDocument.from_trusted(
+        content=raw_text,
+        data=fields.get("data", []),
+        headers=fields.get("headers", []),
+        num_rows=fields.get("num_rows", 0),
+        metadata=metadata
+    )
+
+
+def _build_html(raw_text: str, fields: Dict[str, Any], metadata: FastFileMetadata) -> Document:
+    return HTMLDocument.from_trusted(
+        content=raw_text,
+        title=fields.get("title"),
+        headings=fields.get("headings"),
+        links=fields.get("links"),
+        metadata=metadata
+    )
+
+
+def _build_xml(raw_text: str, fields: Dict[str, Any], metadata: FastFileMetadata) -> Document:
+    return XMLDocument.from_trusted(content=raw_text, structure=fields.get("structure", {}), metadata=metadata)
+
+
+def _build_pptx(raw_text: str, fields: Dict[str, Any], metadata: FastFileMetadata) -> Document:
+    return PPTXDocument.from_trusted(
+        content=raw_text,
+        slides=fields.get("slides", []),
+        num_slides=fields.get("num_slides", 0),
+        metadata=metadata
+    )
+
+
+# Shared, never-mutated stand-in for the fields of non-dict content
+_NO_FIELDS: Dict[str, Any] = {}
+
+_EXT_DISPATCH: Dict[str, Callable[[str, Dict[str, Any], FastFileMetadata], Document]] = {
+    ".txt": _build_text,
+    ".log": _build_text,
+    ".md": _build_text,
+    ".rtf": _build_text,
+    ".pdf": _build_pdf,
+    ".docx": _build_docx,
+    ".doc": _build_docx,
+    ".xlsx": _build_excel,
+    ".xls": _build_excel,
+    ".csv": _build_csv,
+    ".html": _build_html,
+    ".xml": _build_xml,
+    ".pptx": _build_pptx,
+}
 
 
 class BaseReader(ABC):
@@ -16,6 +123,10 @@ class BaseReader(ABC):
     Abstract base class for all document readers.
     Defines the common interface that all specific reader implementations must follow.
     """
+    
+    # Whether reading is dominated by pure-Python CPU work. ReaderFactory.read_files
+    # runs such readers in worker processes instead of threads.
+    cpu_bound: bool = False
 
     def __init__(self, encoding: str = "utf-8"):
         """
@@ -49,25 +160,31 @@ class BaseReader(ABC):
         Returns:
             True if the file extension is supported, False otherwise.
         """
-        file_path = Path(file_path) if isinstance(file_path, str) else file_path
-        return file_path.suffix.lower() in self.supported_extensions
+        return os.path.splitext(os.fspath(file_path))[1].lower() in self.supported_extensions
     
-    def _generate_source_id(self, file_path: Path) -> str:
+    def _generate_source_id(
+        self,
+        file_path: Path,
+        file_stat: Optional[Union[os.stat_result, FastStat]] = None
+    ) -> str:
         """
         Generate a unique source ID for the document.
         
         Args:
             file_path: Path to the file.
+            file_stat: Optional stat result for the file, to avoid stat-ing it again.
             
         Returns:
             A unique source ID as a hexadecimal string.
         """
-        # Use file path and last modified time to create a unique identifier
-        file_stat = file_path.stat()
-        unique_str = f"{file_path.absolute()}_{file_stat.st_mtime}_{file_stat.st_size}"
-        
-        # Create a hash of the unique string
-        return hashlib.md5(unique_str.encode()).hexdigest()
+        # Use file path, last modified time and size to create a unique identifier
+        if file_stat is None:
+            file_stat = fast_stat(file_path)
+        # Only relative paths need os.getcwd() to be resolved
+        path_str = os.fspath(file_path)
+        if not os.path.isabs(path_str):
+            path_str = os.path.abspath(path_str)
+        return _sid_cached(path_str, file_stat.st_mtime_ns, file_stat.st_size)
     
     @error_handler(
         error_type=ReadError,
@@ -75,12 +192,19 @@ class BaseReader(ABC):
         log_traceback=True,
         raise_error=True
     )
-    def read(self, file_path: Union[str, Path], **kwargs) -> Document:
+    def read(
+        self,
+        file_path: Union[str, Path],
+        _prefetched_stat: Optional[Union[os.stat_result, FastStat]] = None,
+        **kwargs
+    ) -> Document:
         """
         Read the file and extract its content.
         
         Args:
             file_path: Path to the file to read.
+            _prefetched_stat: Stat result already obtained by the caller (e.g. from
+                os.scandir). When given, the file is not stat-ed again.
             **kwargs: Additional reader-specific parameters.
             
         Returns:
@@ -90,52 +214,63 @@ class BaseReader(ABC):
             ReadError: If the file cannot be read.
         """
         file_path = Path(file_path) if isinstance(file_path, str) else file_path
+        # Use os.path on the string form below; Path methods build intermediate objects
+        path_str = str(file_path)
         
         # Validate file existence
-        if not file_path.exists():
-            raise ReadError(f"File not found: {file_path}")
+        if _prefetched_stat is not None:
+            file_stat = _prefetched_stat
+        else:
+            try:
+                file_stat = fast_stat(path_str)
+            except FileNotFoundError:
+                raise ReadError(f"File not found: {file_path}") from None
         
         # Validate file size
         max_size_mb = settings.MAX_FILE_SIZE_MB
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+        file_size_mb = file_stat.st_size / (1024 * 1024)
         if file_size_mb > max_size_mb:
             raise ReadError(
                 f"File size ({file_size_mb:.2f} MB) exceeds maximum allowed size ({max_size_mb} MB)"
             )
         
         # Log the reading operation
-        self.logger.info(f"Reading file: {file_path}")
+        self.logger.info("Reading file: %s", file_path)
         
         # Call the implementation-specific read method
-        content, additional_metadata = self._read_file(file_path, **kwargs)
+        # The size from the stat above lets readers size their reads without stat-ing again
+        content, additional_metadata = self._read_file(file_path, _file_size=file_stat.st_size, **kwargs)
         
         # Generate a unique source ID
-        source_id = self._generate_source_id(file_path)
-        
-        # Create metadata
-        metadata = FileMetadata(
-            file_path=str(file_path),
-            file_name=file_path.name,
-            file_extension=file_path.suffix.lower(),
-            file_size_bytes=file_path.stat().st_size,
+        source_id = self._generate_source_id(file_path, file_stat)
+        
+        # Create metadata. All values come from this process (the stat call and
+        # the reader), so the lightweight unvalidated dataclass form is used.
+        metadata_fields = dict(
+            file_path=path_str,
+            file_name=os.path.basename(path_str),
+            file_extension=os.path.splitext(path_str)[1].lower(),
+            file_size_bytes=file_stat.st_size,
             reader_type=self.__class__.__name__,
-            last_modified=datetime.fromtimestamp(file_path.stat().st_mtime),
+            last_modified=datetime.fromtimestamp(file_stat.st_mtime),
             source_id=source_id
         )
         
         # Update metadata with additional information
         if additional_metadata and isinstance(additional_metadata, dict):
             for key, value in additional_metadata.items():
-                if hasattr(metadata, key):
-                    setattr(metadata, key, value)
+                if key in FileMetadata.model_fields:
+                    metadata_fields[key] = value
+        
+        metadata = FastFileMetadata(**metadata_fields)
         
         # Create the document based on reader type and file extension
         document = self._create_document(content, metadata)
         
-        self.logger.info(f"Successfully read file: {file_path}")
+        self.logger.info("Successfully read file: %s", file_path)
         return document
     
-    def _create_document(self, content: Any, metadata: FileMetadata) -> Document:
+    def _create_document(self, content: Any, metadata: FastFileMetadata) -> Document:
         """
         Create a Document instance of the appropriate type based on file extension.
         
@@ -148,48 +283,17 @@ class BaseReader(ABC):
         """
         ext = metadata.file_extension.lower()
         
-        # Convert content to raw text if it's not already
-        if isinstance(content, dict) and "text" in content:
-            raw_text = content["text"]
-        elif isinstance(content, str):
-            raw_text = content
+        # Type-check the content once and convert it to raw text if it's not already
+        if content.__class__ is dict:
+            fields = content
+            raw_text = content["text"] if "text" in content else str(content)
         else:
-            raw_text = str(content)
+            fields = _NO_FIELDS
+            raw_text = content if isinstance(content, str) else str(content)
             
-        # Create the appropriate document type based on file extension
-        if ext in [".txt", ".log", ".md", ".rtf"]:
-            return TextDocument(content=raw_text, metadata=metadata)
-        elif ext == ".pdf":
-            page_texts = content.get("page_texts") if isinstance(content, dict) else None
-            return PDFDocument(content=raw_text, page_texts=page_texts, metadata=metadata)
-        elif ext in [".docx", ".doc"]:
-            paragraphs = content.get("paragraphs") if isinstance(content, dict) else None
-            tables = content.get("tables") if isinstance(content, dict) else None
-            return DocxDocument(content=raw_text, paragraphs=paragraphs, tables=tables, metadata=metadata)
-        elif ext in [".xlsx", ".xls"]:
-            sheets = content.get("sheets") if isinstance(content, dict) else {}
-            sheet_names = content.get("sheet_names") if isinstance(content, dict) else []
-            return ExcelDocument(content=raw_text, sheets=sheets, sheet_names=sheet_names, metadata=metadata)
-        elif ext == ".csv":
-            data = content.get("data") if isinstance(content, dict) else []
-            headers = content.get("headers") if isinstance(content, dict) else []
-            num_rows = content.get("num_rows") if isinstance(content, dict) else 0
-            return CSVDocument(content=raw_text, data=data, headers=headers, num_rows=num_rows, metadata=metadata)
-        elif ext == ".html":
-            title = content.get("title") if isinstance(content, dict) else None
-            headings = content.get("headings") if isinstance(content, dict) else None
-            links = content.get("links") if isinstance(content, dict) else None
-            return HTMLDocument(content=raw_text, title=title, headings=headings, links=links, metadata=metadata)
-        elif ext == ".xml":
-            structure = content.get("structure") if isinstance(content, dict) else {}
-            return XMLDocument(content=raw_text, structure=structure, metadata=metadata)
-        elif ext == ".pptx":
-            slides = content.get("slides") if isinstance(content, dict) else []
-            num_slides = content.get("num_slides") if isinstance(content, dict) else 0
-            return PPTXDocument(content=raw_text, slides=slides, num_slides=num_slides, metadata=metadata)
-        else:
-            # Default to TextDocument for unsupported extensions
-            return TextDocument(content=raw_text, metadata=metadata)
+        # Create the appropriate document type based on file extension,
+        # defaulting to TextDocument for unsupported extensions
+        return _EXT_DISPATCH.get(ext, _build_text)(raw_text, fields, metadata)
     
     @abstractmethod
     def _read_file(self, file_path: Path, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
@@ -199,7 +303,8 @@ class BaseReader(ABC):
         
         Args:
             file_path: Path to the file to read.
-            **kwargs: Additional reader-specific parameters.
+            **kwargs: Additional reader-specific parameters. read() always passes
+                _file_size, the file size in bytes from its stat call.
             
         Returns:
             A tuple containing:
@@ -1,13 +1,92 @@
 # src/readers/doc_reader.py
 import os
+import shutil
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 import tempfile
 import subprocess
+import zipfile
 
 from ..utils.error_handler import ReadError, error_handler
 from ..utils.logger import logger
 from .base_reader import BaseReader
+from .schema import Document
+
+
+# Markdown-style templates for a run, keyed on (bold, italic, underline).
+# Bold takes precedence over italic, which takes precedence over underline.
+_FMT: Dict[Tuple[bool, bool, bool], str] = {
+    (bold, italic, underline): (
+        "**{}**" if bold else "*{}*" if italic else "_{}_" if underline else "{}"
+    )
+    for bold in (False, True)
+    for italic in (False, True)
+    for underline in (False, True)
+}
+
+# WordprocessingML / OPC names used by the lxml fast path in DocReader._read_docx_text
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY_PARAGRAPHS = f"{_W}body/{_W}p"
+_W_R = f"{_W}r"
+_W_T = f"{_W}t"
+_W_BR = f"{_W}br"
+_W_TYPE = f"{_W}type"
+_W_HYPERLINK = f"{_W}hyperlink"
+# Text produced by run children other than <w:t>, matching python-docx's Run.text
+_W_RUN_SPECIAL_TEXT = {
+    f"{_W}tab": "\t",
+    f"{_W}ptab": "\t",
+    f"{_W}cr": "\n",
+    f"{_W}noBreakHyphen": "-",
+}
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_CP = "{http://schemas.openxmlformats.org/package/2006/metadata/core-properties}"
+_DCTERMS = "{http://purl.org/dc/terms/}"
+_CORE_PROPERTY_TAGS = (
+    ("author", f"{_DC}creator"),
+    ("title", f"{_DC}title"),
+    ("created", f"{_DCTERMS}created"),
+    ("modified", f"{_DCTERMS}modified"),
+    ("subject", f"{_DC}subject"),
+    ("keywords", f"{_CP}keywords"),
+    ("category", f"{_CP}category"),
+    ("comments", f"{_DC}description"),
+)
+
+
+def _paragraph_text(paragraph: Any) -> str:
+    """Return the text of a <w:p> element the same way python-docx's Paragraph.text does."""
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            runs = (child,)
+        elif child.tag == _W_HYPERLINK:
+            runs = child.iterfind(_W_R)
+        else:
+            continue
+        for run in runs:
+            for item in run:
+                tag = item.tag
+                if tag == _W_T:
+                    parts.append(item.text or "")
+                elif tag == _W_BR:
+                    if item.get(_W_TYPE) in (None, "textWrapping"):
+                        parts.append("\n")
+                elif tag in _W_RUN_SPECIAL_TEXT:
+                    parts.append(_W_RUN_SPECIAL_TEXT[tag])
+    return "".join(parts)
+
+
+def _paragraph_counts(paragraphs: List[str]) -> Tuple[int, int]:
+    """
+    Return the word and character counts of "\\n".join(paragraphs).
+    
+    Counting per paragraph avoids splitting the whole joined text into one big word list.
+    """
+    word_count = sum(len(p.split()) for p in paragraphs)
+    character_count = sum(map(len, paragraphs)) + max(len(paragraphs) - 1, 0)
+    return word_count, character_count
 
 
 class DocReader(BaseReader):
@@ -16,6 +95,14 @@ class DocReader(BaseReader):
     Extracts content, structure, and metadata from Word documents.
     """
     
+    # python-docx walks the document with pure-Python objects
+    cpu_bound = True
+    
+    # .doc extraction backends, in order of preference
+    _DOC_BACKENDS: Tuple[str, ...] = ("textract", "mammoth", "antiword", "libreoffice_conversion")
+    # First backend found to work, tried before the others on later reads
+    _DOC_BACKEND: Optional[str] = None
+    
     @property
     def supported_extensions(self) -> list[str]:
         """List of supported file extensions."""
@@ -39,6 +126,8 @@ class DocReader(BaseReader):
                 - extract_images: Whether to extract image references (default is False).
                 - include_style_info: Whether to include style information (default is False).
                 - preserve_formatting: Whether to preserve formatting like bold, italic (default is False).
+                - _converted_docx: Path to a .docx already converted from this .doc file
+                  (set by read_batch).
                 
         Returns:
             A tuple containing:
@@ -63,7 +152,7 @@ class DocReader(BaseReader):
                 preserve_formatting=preserve_formatting
             )
         elif ext == ".doc":
-            return self._read_doc(file_path)
+            return self._read_doc(file_path, converted_docx=kwargs.get("_converted_docx"))
         else:
             raise ReadError(f"Unsupported file extension: {ext}")
     
@@ -92,6 +181,14 @@ class DocReader(BaseReader):
                 - A dictionary with the document content and structure
                 - A dictionary with metadata about the document
         """
+        # Plain body text needs none of python-docx's object model, so parse the XML directly
+        if not (extract_tables or extract_headers_footers or extract_images
+                or include_style_info or preserve_formatting):
+            try:
+                return self._read_docx_text(file_path)
+            except ImportError:
+                logger.debug("lxml is not available, falling back to python-docx")
+        
         try:
             import docx
         except ImportError:
@@ -107,31 +204,19 @@ class DocReader(BaseReader):
             for para in doc.paragraphs:
                 if preserve_formatting:
                     # This is a simplified version, more complex formatting would need more work
-                    text = ""
-                    for run in para.runs:
-                        if run.bold:
-                            text += f"**{run.text}**"
-                        elif run.italic:
-                            text += f"*{run.text}*"
-                        elif run.underline:
-                            text += f"_{run.text}_"
-                        else:
-                            text += run.text
+                    text = "".join(
+                        _FMT[(bool(run.bold), bool(run.italic), bool(run.underline))].format(run.text)
+                        for run in para.runs
+                    )
                     paragraphs.append(text)
                 else:
                     paragraphs.append(para.text)
             
             # Extract tables if requested
-            tables = []
-            if extract_tables:
-                for table in doc.tables:
-                    table_data = []
-                    for row in table.rows:
-                        row_data = []
-                        for cell in row.cells:
-                            row_data.append(cell.text)
-                        table_data.append(row_data)
-                    tables.append(table_data)
+            tables = [
+                [[cell.text for cell in row.cells] for row in table.rows]
+                for table in doc.tables
+            ] if extract_tables else []
             
             # Extract headers and footers if requested
             headers = []
@@ -168,28 +253,15 @@ class DocReader(BaseReader):
             
             # Extract document properties/metadata
             doc_properties = {}
-            if hasattr(doc, 'core_properties'):
-                props = doc.core_properties
-                if hasattr(props, 'author') and props.author:
-                    doc_properties["author"] = props.author
-                if hasattr(props, 'title') and props.title:
-                    doc_properties["title"] = props.title
-                if hasattr(props, 'created') and props.created:
-                    doc_properties["created"] = props.created
-                if hasattr(props, 'modified') and props.modified:
-                    doc_properties["modified"] = props.modified
-                if hasattr(props, 'subject') and props.subject:
-                    doc_properties["subject"] = props.subject
-                if hasattr(props, 'keywords') and props.keywords:
-                    doc_properties["keywords"] = props.keywords
-                if hasattr(props, 'category') and props.category:
-                    doc_properties["category"] = props.category
-                if hasattr(props, 'comments') and props.comments:
-                    doc_properties["comments"] = props.comments
+            props = getattr(doc, "core_properties", None)
+            if props is not None:
+                for name, _ in _CORE_PROPERTY_TAGS:
+                    value = getattr(props, name, None)
+                    if value:
+                        doc_properties[name] = value
             
             # Calculate word and character counts
-            word_count = len(full_text.split())
-            character_count = len(full_text)
+            word_count, character_count = _paragraph_counts(paragraphs)
             
             # Prepare content dictionary
             content = {
@@ -219,12 +291,154 @@ class DocReader(BaseReader):
         except Exception as e:
             raise ReadError(f"Error reading .docx file {file_path}: {str(e)}", original_error=e)
     
-    def _read_doc(self, file_path: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    def _read_docx_text(self, file_path: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Read only the body paragraphs and core properties of a .docx file with lxml.
+        
+        Args:
+            file_path: Path to the .docx file.
+            
+        Returns:
+            A tuple shaped like the one returned by _read_docx, with empty
+            tables, headers, footers, image references and styles.
+            
+        Raises:
+            ImportError: If lxml is not installed.
+        """
+        from lxml import etree
+        
+        logger.info(f"Reading .docx file text: {file_path}")
+        
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                with archive.open("word/document.xml") as document_xml:
+                    root = etree.parse(document_xml).getroot()
+                
+                doc_properties = {}
+                if "docProps/core.xml" in archive.namelist():
+                    with archive.open("docProps/core.xml") as core_xml:
+                        core = etree.parse(core_xml).getroot()
+                    for name, tag in _CORE_PROPERTY_TAGS:
+                        value = core.findtext(tag)
+                        if not value:
+                            continue
+                        if name in ("created", "modified"):
+                            try:
+                                value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+                            except ValueError:
+                                pass
+                        doc_properties[name] = value
+            
+            paragraphs = [_paragraph_text(p) for p in root.iterfind(_W_BODY_PARAGRAPHS)]
+            full_text = "\n".join(paragraphs)
+            
+            content = {
+                "text": full_text,
+                "paragraphs": paragraphs,
+                "tables": [],
+                "headers": [],
+                "footers": [],
+                "image_references": [],
+                "styles": []
+            }
+            
+            word_count, character_count = _paragraph_counts(paragraphs)
+            
+            metadata = {
+                "word_count": word_count,
+                "character_count": character_count,
+                "paragraph_count": len(paragraphs),
+                "table_count": 0,
+                "content_type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                **doc_properties
+            }
+            
+            logger.info(f"Successfully read .docx file text {file_path}: {len(paragraphs)} paragraphs")
+            
+            return content, metadata
+            
+        except Exception as e:
+            raise ReadError(f"Error reading .docx file {file_path}: {str(e)}", original_error=e)
+    
+    def read_batch(self, file_paths: List[Union[str, Path]], **kwargs) -> List[Document]:
+        """
+        Read several Word documents, converting all .doc files with a single LibreOffice run.
+        
+        LibreOffice takes seconds to start, so when more than one .doc file is given
+        they are converted to .docx together and each conversion is then read.
+        Files that cannot be converted this way are read individually.
+        
+        Args:
+            file_paths: Paths to the Word documents to read.
+            **kwargs: Additional parameters passed to read().
+            
+        Returns:
+            A list of Document objects in the same order as file_paths.
+        """
+        file_paths = [Path(p) if isinstance(p, str) else p for p in file_paths]
+        
+        # LibreOffice names each output after the input stem, so only one file per stem can be batched
+        doc_paths = {}
+        for file_path in file_paths:
+            if file_path.suffix.lower() == ".doc":
+                doc_paths.setdefault(file_path.stem, file_path)
+        
+        if len(doc_paths) <= 1:
+            return [self.read(file_path, **kwargs) for file_path in file_paths]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            converted = self._convert_with_libreoffice(list(doc_paths.values()), Path(tmp_dir))
+            return [
+                self.read(file_path, _converted_docx=converted.get(file_path), **kwargs)
+                for file_path in file_paths
+            ]
+    
+    def _convert_with_libreoffice(self, file_paths: List[Path], output_dir: Path) -> Dict[Path, Path]:
+        """
+        Convert .doc files to .docx with one LibreOffice invocation.
+        
+        Args:
+            file_paths: Paths to the .doc files to convert.
+            output_dir: Directory to write the converted files to.
+            
+        Returns:
+            A dictionary mapping each successfully converted input path to its .docx file.
+        """
+        if shutil.which("libreoffice") is None:
+            logger.warning("LibreOffice is not available for .doc conversion")
+            return {}
+        
+        logger.info(f"Converting {len(file_paths)} .doc file(s) to .docx using LibreOffice")
+        try:
+            subprocess.run([
+                "libreoffice", 
+                "--headless", 
+                "--convert-to", 
+                "docx", 
+                "--outdir", 
+                str(output_dir), 
+                *[str(file_path) for file_path in file_paths]
+            ], capture_output=True, check=True)
+        except (subprocess.SubprocessError, FileNotFoundError) as e:
+            logger.warning(f"Failed to convert .doc with LibreOffice: {str(e)}")
+            return {}
+        
+        converted = {}
+        for file_path in file_paths:
+            output_file = output_dir / f"{file_path.stem}.docx"
+            if output_file.exists():
+                converted[file_path] = output_file
+            else:
+                logger.warning(f"LibreOffice conversion failed to produce output file for {file_path}")
+        return converted
+    
+    def _read_doc(self, file_path: Path, converted_docx: Optional[Path] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Read a .doc file using a combination of approaches (textract or antiword).
         
         Args:
             file_path: Path to the .doc file.
+            converted_docx: Optional .docx already converted from file_path by LibreOffice.
             
         Returns:
             A tuple containing:
@@ -235,66 +449,29 @@ class DocReader(BaseReader):
         text = None
         method_used = None
         
-        # Method 1: Try using textract if available
-        if text is None:
-            try:
-                import textract
-                logger.info(f"Reading .doc file with textract: {file_path}")
-                text = textract.process(str(file_path), extension="doc").decode("utf-8")
-                method_used = "textract"
-            except (ImportError, Exception) as e:
-                logger.warning(f"Failed to read .doc with textract: {str(e)}")
-        
-        # Method 2: Try using mammoth if available
-        if text is None:
-            try:
-                import mammoth
-                logger.info(f"Reading .doc file with mammoth: {file_path}")
-                with open(file_path, "rb") as docx_file:
-                    result = mammoth.extract_raw_text(docx_file)
-                    text = result.value
-                method_used = "mammoth"
-            except (ImportError, Exception) as e:
-                logger.warning(f"Failed to read .doc with mammoth: {str(e)}")
-        
-        # Method 3: Try using antiword if available
-        if text is None:
-            try:
-                logger.info(f"Reading .doc file with antiword: {file_path}")
-                text = subprocess.check_output(["antiword", str(file_path)]).decode("utf-8")
-                method_used = "antiword"
-            except (subprocess.SubprocessError, FileNotFoundError) as e:
-                logger.warning(f"Failed to read .doc with antiword: {str(e)}")
+        # Use the batch conversion result if one was provided
+        if converted_docx is not None:
+            content, metadata = self._read_docx(converted_docx)
+            text = content["text"]
+            method_used = "libreoffice_conversion"
         
-        # Method 4: Try converting to .docx and then reading it
+        # Try each backend, starting with the one that worked last time
         if text is None:
-            try:
-                # Check if libreoffice is available
-                subprocess.check_output(["libreoffice", "--version"])
-                
-                with tempfile.TemporaryDirectory() as tmp_dir:
-                    tmp_path = Path(tmp_dir)
-                    output_file = tmp_path / f"{file_path.stem}.docx"
-                    
-                    logger.info(f"Converting .doc to .docx using LibreOffice: {file_path}")
-                    subprocess.run([
-                        "libreoffice", 
-                        "--headless", 
-                        "--convert-to", 
-                        "docx", 
-                        "--outdir", 
-                        tmp_dir, 
-                        str(file_path)
-                    ], capture_output=True, check=True)
-                    
-                    if output_file.exists():
-                        content, metadata = self._read_docx(output_file)
-                        text = content["text"]
-                        method_used = "libreoffice_conversion"
-                    else:
-                        logger.warning("LibreOffice conversion failed to produce output file")
-            except (subprocess.SubprocessError, FileNotFoundError) as e:
-                logger.warning(f"Failed to convert .doc with LibreOffice: {str(e)}")
+            cached = DocReader._DOC_BACKEND
+            backends = self._DOC_BACKENDS if cached is None else (
+                (cached,) + tuple(b for b in self._DOC_BACKENDS if b != cached)
+            )
+            for backend in backends:
+                try:
+                    logger.info(f"Reading .doc file with {backend}: {file_path}")
+                    text = getattr(self, f"_doc_text_{backend}")(file_path)
+                except Exception as e:
+                    logger.warning(f"Failed to read .doc with {backend}: {str(e)}")
+                    continue
+                method_used = backend
+                if DocReader._DOC_BACKEND is None:
+                    DocReader._DOC_BACKEND = backend
+                break
         
         # If all methods failed, raise an error
         if text is None:
@@ -331,4 +508,28 @@ class DocReader(BaseReader):
         
         logger.info(f"Successfully read .doc file {file_path} using {method_used}: {len(paragraphs)} paragraphs")
         
-        return content, metadata
\ No newline at end of file
+        return content, metadata
+    
+    def _doc_text_textract(self, file_path: Path) -> str:
+        """Extract .doc text with textract."""
+        import textract
+        return textract.process(str(file_path), extension="doc").decode("utf-8")
+    
+    def _doc_text_mammoth(self, file_path: Path) -> str:
+        """Extract .doc text with mammoth."""
+        import mammoth
+        with open(file_path, "rb") as docx_file:
+            return mammoth.extract_raw_text(docx_file).value
+    
+    def _doc_text_antiword(self, file_path: Path) -> str:
+        """Extract .doc text with antiword."""
+        return subprocess.check_output(["antiword", str(file_path)]).decode("utf-8")
+    
+    def _doc_text_libreoffice_conversion(self, file_path: Path) -> str:
+        """Extract .doc text by converting it to .docx with LibreOffice."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = self._convert_with_libreoffice([file_path], Path(tmp_dir)).get(file_path)
+            if output_file is None:
+                raise ReadError("LibreOffice conversion failed to produce output file")
+            content, _ = self._read_docx(output_file)
+            return content["text"]
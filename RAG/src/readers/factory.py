@@ -1,10 +1,14 @@
 # src/readers/factory.py
+import multiprocessing
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, FrozenSet, List, Optional, Type, Union
 
 from ..utils.error_handler import ReadError
 from ..utils.logger import logger
 from .base_reader import BaseReader
+from .schema import Document
 from .txt_reader import TxtReader
 from .doc_reader import DocReader
 # Import other readers when they are created
@@ -25,6 +29,8 @@ class ReaderFactory:
         """Initialize the reader factory with available readers."""
         self._readers: Dict[str, Type[BaseReader]] = {}
         self._reader_instances: Dict[str, BaseReader] = {}
+        # Rebuilt on every (un)registration for O(1) membership checks
+        self._supported_set: FrozenSet[str] = frozenset()
         
         # Register built-in readers
         self.register_reader(TxtReader)
@@ -41,8 +47,11 @@ class ReaderFactory:
         Args:
             reader_class: The reader class to register.
         """
-        # Initialize the reader instance
-        reader_instance = reader_class()
+        # Reuse the instance already serving this reader class, if any
+        reader_instance = next(
+            (instance for instance in self._reader_instances.values() if type(instance) is reader_class),
+            None
+        ) or reader_class()
         
         # Register the reader for each supported extension
         for ext in reader_instance.supported_extensions:
@@ -54,7 +63,8 @@ class ReaderFactory:
                 )
             self._readers[ext] = reader_class
             self._reader_instances[ext] = reader_instance
-            
+        self._supported_set = frozenset(self._readers)
+        
         logger.info(
             f"Registered {reader_class.__name__} for extensions: {', '.join(reader_instance.supported_extensions)}"
         )
@@ -72,6 +82,7 @@ class ReaderFactory:
             del self._readers[extension]
             if extension in self._reader_instances:
                 del self._reader_instances[extension]
+            self._supported_set = frozenset(self._readers)
             logger.info(f"Unregistered {reader_class.__name__} for extension '{extension}'")
         else:
             logger.warning(f"No reader registered for extension '{extension}'")
@@ -86,18 +97,24 @@ class ReaderFactory:
         Returns:
             A reader instance if a suitable reader is found, None otherwise.
         """
-        file_path = Path(file_path) if isinstance(file_path, str) else file_path
-        extension = file_path.suffix.lower()
-        
-        if extension in self._reader_instances:
-            return self._reader_instances[extension]
+        extension = os.path.splitext(os.fspath(file_path))[1].lower()
         
-        # Try to find a reader that can handle this file
-        for reader_instance in self._reader_instances.values():
-            if reader_instance.can_handle(file_path):
-                return reader_instance
+        # Readers are keyed by lowercased extension, so a miss means no reader can handle it
+        if extension not in self._supported_set:
+            return None
+        return self._reader_instances[extension]
+    
+    def is_supported(self, file_path: Union[str, Path]) -> bool:
+        """
+        Check whether a reader is registered for the file's extension.
         
-        return None
+        Args:
+            file_path: Path to the file.
+            
+        Returns:
+            True if the file can be read, False otherwise.
+        """
+        return os.path.splitext(os.fspath(file_path))[1].lower() in self._supported_set
     
     def get_supported_extensions(self) -> List[str]:
         """
@@ -122,13 +139,11 @@ class ReaderFactory:
         Raises:
             ReadError: If no suitable reader is found or if reading fails.
         """
-        file_path = Path(file_path) if isinstance(file_path, str) else file_path
-        
         # Get the appropriate reader
         reader = self.get_reader_for_file(file_path)
         
         if reader is None:
-            extension = file_path.suffix.lower()
+            extension = os.path.splitext(os.fspath(file_path))[1].lower()
             supported = ", ".join(self.get_supported_extensions())
             raise ReadError(
                 f"No reader found for file extension '{extension}'. "
@@ -138,6 +153,100 @@ class ReaderFactory:
         # Read the file
         logger.info(f"Using {reader.__class__.__name__} to read {file_path}")
         return reader.read(file_path, **kwargs)
+    
+    def read_files(
+        self,
+        file_paths: List[Union[str, Path]],
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> List[Document]:
+        """
+        Read several files concurrently.
+        
+        Files whose reader is I/O-bound (file, zip and lxml work that releases the GIL)
+        are read in a thread pool; files whose reader is marked cpu_bound are read in
+        a process pool so they are not serialized on the GIL.
+        
+        Args:
+            file_paths: Paths to the files to read.
+            max_workers: Maximum number of workers per pool. Defaults to the executor default.
+            **kwargs: Additional reader-specific parameters.
+            
+        Returns:
+            A list of Document objects in the same order as file_paths.
+            
+        Raises:
+            ReadError: If no suitable reader is found for a file or if reading fails.
+        """
+        readers = []
+        for file_path in file_paths:
+            reader = self.get_reader_for_file(file_path)
+            if reader is None:
+                extension = os.path.splitext(os.fspath(file_path))[1].lower()
+                supported = ", ".join(self.get_supported_extensions())
+                raise ReadError(
+                    f"No reader found for file extension '{extension}'. "
+                    f"Supported extensions are: {supported}"
+                )
+            readers.append(reader)
+        
+        use_processes = sum(reader.cpu_bound for reader in readers) > 1
+        thread_pool = ThreadPoolExecutor(max_workers=max_workers)
+        # spawn avoids forking a process that holds logging locks and open handlers
+        process_pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        ) if use_processes else None
+        
+        try:
+            futures: List[Future] = []
+            for file_path, reader in zip(file_paths, readers):
+                pool: Executor = process_pool if (use_processes and reader.cpu_bound) else thread_pool
+                futures.append(pool.submit(reader.read, file_path, **kwargs))
+            documents = [future.result() for future in futures]
+        finally:
+            thread_pool.shutdown(cancel_futures=True)
+            if process_pool is not None:
+                process_pool.shutdown(cancel_futures=True)
+        
+        logger.info(f"Read {len(documents)} documents concurrently")
+        return documents
+    
+    def read_directory(self, dir_path: Union[str, Path], **kwargs) -> List[Document]:
+        """
+        Read all supported files in a directory (non-recursive).
+        
+        Uses os.scandir so the stat information cached on each directory entry
+        is handed to the reader instead of being fetched again per file.
+        
+        Args:
+            dir_path: Path to the directory to read.
+            **kwargs: Additional reader-specific parameters.
+            
+        Returns:
+            A list of Document objects, one per supported file, ordered by file name.
+            
+        Raises:
+            ReadError: If the directory cannot be listed or a file fails to read.
+        """
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(
+                    (entry for entry in it if entry.is_file()),
+                    key=lambda entry: entry.name
+                )
+        except OSError as e:
+            raise ReadError(f"Failed to list directory {dir_path}: {str(e)}", original_error=e)
+        
+        documents = []
+        for entry in entries:
+            reader = self._reader_instances.get(os.path.splitext(entry.name)[1].lower())
+            if reader is None:
+                continue
+            documents.append(reader.read(entry.path, _prefetched_stat=entry.stat(), **kwargs))
+        
+        logger.info(f"Read {len(documents)} documents from {dir_path}")
+        return documents
 
 
 # Create a singleton instance of the factory
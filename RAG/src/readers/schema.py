@@ -143,21 +143,77 @@
 
 
 # src/readers/schema.py
+import dataclasses
+import functools
+import hashlib
+import json
+import sys
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from uuid import uuid4
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
 
-from pydantic import BaseModel, Field, model_validator, field_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator, field_validator, field_serializer
 
 
-class FileMetadata(BaseModel):
-    """Metadata about a file processed by a reader."""
+def as_embedding_array(embeddings: Any) -> np.ndarray:
+    """
+    Convert embeddings to the 2-D float32 array stored on Document.chunk_embeddings.
+    
+    Args:
+        embeddings: A list of embedding vectors or an array.
+        
+    Returns:
+        An array of shape (n_chunks, dim); (0, 0) when there are no embeddings.
+    """
+    array = np.asarray(embeddings, dtype=np.float32)
+    if array.size == 0:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.ascontiguousarray(array.reshape(len(array), -1))
+
+
+def make_chunk_id(document_id: str, chunk_index: int) -> str:
+    """
+    Build a stable chunk ID from the source document ID and the chunk position.
+    
+    Args:
+        document_id: ID of the source document.
+        chunk_index: Position of the chunk in the document.
+        
+    Returns:
+        A 16-character hexadecimal ID.
+    """
+    return hashlib.blake2b(f"{document_id}:{chunk_index}".encode(), digest_size=8).hexdigest()
+
+
+class TrustedModel(BaseModel):
+    """
+    Base model with a validation-free constructor for data produced in-process.
+    Use regular construction/model_validate for data from external sources.
+    """
+
+    @classmethod
+    def from_trusted(cls, **data: Any):
+        """
+        Build an instance from already-valid data without running validation.
+        Fields not given take their defaults; model_fields_set records the given ones.
+        """
+        return cls.model_construct(**data)
+
+
+class FileMetadata(TrustedModel):
+    """
+    Metadata about a file processed by a reader.
+    Immutable: use model_copy(update=...) to record chunking/embedding info.
+    """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     file_path: str
     file_name: str
     file_extension: str
     file_size_bytes: int
-    last_modified: Optional[datetime] = None
+    last_modified: datetime  # Supplied by the reader from its single stat() of the file
     reader_type: str
     content_type: Optional[str] = None
     num_pages: Optional[int] = None
@@ -170,41 +226,176 @@ class FileMetadata(BaseModel):
     embeddings_info: Optional[Dict[str, Any]] = Field(None, description="Information about embeddings generated") # Added embedding metadata
 
 
-    @field_validator('last_modified', mode='before')
-    @classmethod
-    def set_last_modified(cls, v, info):
-        """Set last_modified from file_path if not provided."""
-        if v is None and 'file_path' in info.data:
-            try:
-                path = Path(info.data['file_path'])
-                if path.exists():
-                    return datetime.fromtimestamp(path.stat().st_mtime)
-            except Exception:
-                pass # Ignore errors if file path is invalid or stat fails
-        return v
-
-
-class Document(BaseModel):
+
+# slots=True needs Python 3.10+; older versions get a regular (dict-backed) dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
+class FastFileMetadata:
+    """
+    Lightweight twin of FileMetadata for metadata built by the readers.
+    
+    Has the same fields, but instances are plain slotted dataclasses, which are
+    cheaper to create and smaller than pydantic models. model_copy() is provided
+    so code that updates metadata works with either type; use to_file_metadata()
+    where a real FileMetadata is required.
+    """
+    file_path: str
+    file_name: str
+    file_extension: str
+    file_size_bytes: int
+    last_modified: datetime
+    reader_type: str
+    content_type: Optional[str] = None
+    num_pages: Optional[int] = None
+    word_count: Optional[int] = None
+    character_count: Optional[int] = None
+    author: Optional[str] = None
+    creation_date: Optional[datetime] = None
+    source_id: Optional[str] = None
+    chunks_info: Optional[Dict[str, Any]] = None
+    embeddings_info: Optional[Dict[str, Any]] = None
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "FastFileMetadata":
+        """Return a copy with the given fields replaced, like BaseModel.model_copy (deep is ignored)."""
+        return dataclasses.replace(self, **(update or {}))
+
+    def to_file_metadata(self) -> FileMetadata:
+        """Convert to a FileMetadata model."""
+        return FileMetadata.from_trusted(
+            **{field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+        )
+
+
+class Document(TrustedModel):
     """
     Base model for document content with metadata.
     This keeps content and its metadata together for better traceability in RAG.
     """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     content: str = Field(..., description="The extracted text content")
-    metadata: FileMetadata
+    metadata: Union[FileMetadata, FastFileMetadata]
     chunks: List[str] = Field(default_factory=list, description="List of text chunks derived from the content")
-    # >>> ADD THIS FIELD FOR EMBEDDINGS <<<
-    chunk_embeddings: Optional[List[List[float]]] = Field(default=None, description="List of embeddings for each chunk")
-    # >>> ADD THIS FIELD FOR EMBEDDINGS <<<
-
+    # One contiguous float32 row per chunk instead of nested lists of Python floats
+    chunk_embeddings: Optional[np.ndarray] = Field(default=None, description="Embeddings array of shape (n_chunks, dim)")
 
-    @field_validator('content')
+    @field_validator('chunk_embeddings', mode='before')
     @classmethod
-    def validate_content_not_empty(cls, v):
-        """Validate that content is not empty."""
-        if not v or not v.strip():
-            pass # Allow empty content/handle downstream
+    def coerce_chunk_embeddings(cls, v):
+        """Convert nested lists (or other arrays) to a 2-D float32 array."""
+        if v is None:
+            return v
+        # Quantized embeddings are kept as they are; see quantize_embeddings()
+        if isinstance(v, np.ndarray) and v.dtype == np.int8:
+            return v
+        return as_embedding_array(v)
+
+    @field_serializer('chunk_embeddings', when_used='json')
+    def serialize_chunk_embeddings(self, v):
+        """Write embeddings as nested lists in JSON output."""
+        return None if v is None else v.tolist()
+
+
+    def quantize_embeddings(self) -> None:
+        """
+        Quantize chunk_embeddings in place to int8 for storage.
+        
+        Uses symmetric quantization with one scale per chunk vector
+        (scale = max|x| / 127 over the row, zero point 0), so a vector with large
+        values does not cost the others their precision. The scheme is recorded in
+        metadata.embeddings_info as dtype, scale (a list with one entry per row)
+        and zero_point.
+        """
+        embeddings = self.chunk_embeddings
+        if embeddings is None or embeddings.dtype == np.int8:
+            return
+        
+        max_abs = np.abs(embeddings).max(axis=1, keepdims=True)
+        # All-zero rows quantize to zeros with any scale
+        scales = np.where(max_abs > 0, max_abs / 127, 1.0).astype(np.float32)
+        self.chunk_embeddings = np.round(embeddings / scales).astype(np.int8)
+        
+        embeddings_info = dict(self.metadata.embeddings_info or {})
+        embeddings_info.update({"dtype": "int8", "scale": scales.ravel().tolist(), "zero_point": 0})
+        self.metadata = self.metadata.model_copy(update={"embeddings_info": embeddings_info})
+
+    def dequantize(self) -> Optional[np.ndarray]:
+        """
+        Get chunk_embeddings as float32, undoing int8 quantization if applied.
+        
+        Returns:
+            A float32 array of shape (n_chunks, dim), or None if there are no embeddings.
+        """
+        embeddings = self.chunk_embeddings
+        if embeddings is None or embeddings.dtype != np.int8:
+            return embeddings
+        
+        embeddings_info = self.metadata.embeddings_info or {}
+        # One scale per row; a single number from documents quantized with one
+        # scale for the whole array also broadcasts
+        scale = np.asarray(embeddings_info.get("scale", 1.0), dtype=np.float32)
+        if scale.ndim:
+            scale = scale.reshape(-1, 1)
+        zero_point = embeddings_info.get("zero_point", 0)
+        return (embeddings.astype(np.float32) - zero_point) * scale
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Save the document to disk.
+        
+        Everything except the embeddings goes to <path>.json (written with orjson
+        when installed); the embeddings array goes to a side-car <path>.npy so it
+        is stored as raw bytes instead of JSON numbers.
+        
+        Args:
+            path: Base path for the files; any suffix is replaced.
+        """
+        path = Path(path)
+        try:
+            import orjson
+            payload = orjson.dumps(
+                self.model_dump(exclude={'chunk_embeddings'}),
+                option=orjson.OPT_SERIALIZE_NUMPY
+            )
+        except ImportError:
+            payload = self.model_dump_json(exclude={'chunk_embeddings'}).encode()
+        path.with_suffix('.json').write_bytes(payload)
+        
+        npy_path = path.with_suffix('.npy')
+        if self.chunk_embeddings is not None:
+            np.save(npy_path, self.chunk_embeddings)
+        else:
+            # Don't leave embeddings from an earlier save next to the new JSON
+            npy_path.unlink(missing_ok=True)
 
-        return v
+    @classmethod
+    def load(cls, path: Union[str, Path]):
+        """
+        Load a document written by save().
+        
+        Only the metadata is validated (to parse its dates); the remaining fields
+        were produced by save() and are set without validation.
+        
+        Args:
+            path: Base path the document was saved under.
+            
+        Returns:
+            The loaded document.
+        """
+        path = Path(path)
+        payload = path.with_suffix('.json').read_bytes()
+        try:
+            import orjson
+            data = orjson.loads(payload)
+        except ImportError:
+            data = json.loads(payload)
+        
+        data['metadata'] = FileMetadata.model_validate(data['metadata'])
+        npy_path = path.with_suffix('.npy')
+        data['chunk_embeddings'] = np.load(npy_path) if npy_path.exists() else None
+        return cls.model_construct(**data)
 
     def get_source_info(self) -> str:
         """Get a formatted string with source information for citations."""
@@ -261,24 +452,105 @@ class PPTXDocument(Document):
     num_slides: int = Field(..., description="Number of slides in the presentation")
 
 
-class DocumentChunk(BaseModel):
+class DocumentChunk(TrustedModel):
     """
     A chunk of a document used for embedding and retrieval.
     Contains the chunk text, position in original document, and original metadata.
+    Immutable: use model_copy(update=...) to change fields.
     """
+    model_config = ConfigDict(frozen=True, extra='forbid', ignored_types=(cached_property,))
+
     text: str = Field(..., description="The chunk text content")
-    chunk_id: str = Field(default_factory=lambda: str(uuid4()), description="Unique identifier for the chunk")
+    chunk_id: str = Field("", description="Unique identifier for the chunk; derived from document_id and chunk_index if not given")
     document_id: str = Field(..., description="ID of the source document")
     chunk_index: int = Field(..., description="Position of chunk in document")
-    metadata: FileMetadata = Field(..., description="Original document metadata")
+    metadata: Union[FileMetadata, FastFileMetadata] = Field(..., description="Original document metadata")
     # Optional: Add the embedding for this specific chunk here if storing chunks separately
     # embedding: Optional[List[float]] = Field(None, description="Embedding vector for this chunk")
 
-    def get_retrieval_context(self) -> str:
-        """Format chunk for inclusion in retrieval context."""
+    @model_validator(mode='before')
+    @classmethod
+    def set_chunk_id(cls, data: Any) -> Any:
+        """Derive chunk_id from the document and position when not given."""
+        if (
+            isinstance(data, dict)
+            and not data.get("chunk_id")
+            and "document_id" in data
+            and "chunk_index" in data
+        ):
+            data = {**data, "chunk_id": make_chunk_id(data["document_id"], data["chunk_index"])}
+        return data
+
+    @classmethod
+    def from_trusted(cls, **data: Any):
+        """
+        Build a chunk from already-valid data without running validation.
+        chunk_id is derived as in set_chunk_id when not given.
+        """
+        if not data.get("chunk_id"):
+            data["chunk_id"] = make_chunk_id(data["document_id"], data["chunk_index"])
+        return cls.model_construct(**data)
+
+    @cached_property
+    def _retrieval_prefix(self) -> str:
+        """Source header for retrieval context, built once per chunk."""
         source_info = f"{self.metadata.file_name}"
         # The check for 'page_number' might fail if it's not added to metadata
         # or DocumentChunk. Consider adding it explicitly if needed.
         # if self.metadata.num_pages and hasattr(self, 'page_number'):
         #     source_info += f" (page {self.page_number})"
-        return f"[{source_info}]\n{self.text}"
\ No newline at end of file
+        return f"[{source_info}]\n"
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        """Copy the chunk, dropping the cached retrieval prefix in case metadata changes."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop('_retrieval_prefix', None)
+        return copied
+
+    def get_retrieval_context(self) -> str:
+        """Format chunk for inclusion in retrieval context."""
+        return self._retrieval_prefix + self.text
+
+
+# Adapters compile their validation schema once; reuse them for bulk validation
+# of data arriving from outside the pipeline.
+_CHUNK_LIST_ADAPTER = TypeAdapter(List[DocumentChunk])
+
+
+@functools.lru_cache(maxsize=None)
+def _document_list_adapter(document_type: Type[Document]) -> TypeAdapter:
+    """Get the cached list adapter for a Document type."""
+    return TypeAdapter(List[document_type])
+
+
+def validate_chunks(data: Iterable[Any]) -> List[DocumentChunk]:
+    """
+    Validate a batch of chunk dicts (or DocumentChunk objects) in one pass.
+    
+    Args:
+        data: Chunk data from an untrusted source.
+        
+    Returns:
+        A list of validated DocumentChunk objects.
+        
+    Raises:
+        pydantic.ValidationError: If any chunk is invalid.
+    """
+    return _CHUNK_LIST_ADAPTER.validate_python(data)
+
+
+def validate_documents(data: Iterable[Any], document_type: Type[Document] = Document) -> List[Document]:
+    """
+    Validate a batch of document dicts in one pass.
+    
+    Args:
+        data: Document data from an untrusted source.
+        document_type: The Document subclass to validate against.
+        
+    Returns:
+        A list of validated documents of the given type.
+        
+    Raises:
+        pydantic.ValidationError: If any document is invalid.
+    """
+    return _document_list_adapter(document_type).validate_python(data)
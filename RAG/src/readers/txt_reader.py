@@ -1,9 +1,107 @@
 # src/readers/txt_reader.py
+import codecs
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
 
-from ..utils.error_handler import ReadError, error_handler
+import numpy as np
+
+from ..utils.error_handler import ReadError, handle_error
 from .base_reader import BaseReader
+from .schema import Document
+
+
+# Bytes fed to chardet's incremental detector at a time
+_DETECT_CHUNK_SIZE = 8192
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding_detector() -> Callable[[bytes], Tuple[Optional[str], Optional[float]]]:
+    """
+    Pick the fastest available encoding detector, once per process.
+    
+    Prefers cchardet (C bindings to uchardet), then charset_normalizer, then
+    the pure-Python chardet.
+    
+    Returns:
+        A function mapping a byte buffer to an (encoding, confidence) pair.
+    """
+    try:
+        import cchardet
+        
+        def detect(raw_data: bytes) -> Tuple[Optional[str], Optional[float]]:
+            detected = cchardet.detect(raw_data)
+            return detected["encoding"], detected["confidence"]
+        return detect
+    except ImportError:
+        pass
+    
+    try:
+        from charset_normalizer import from_bytes
+        
+        def detect(raw_data: bytes) -> Tuple[Optional[str], Optional[float]]:
+            best = from_bytes(raw_data).best()
+            if best is None:
+                return None, None
+            return best.encoding, 1.0 - best.chaos
+        return detect
+    except ImportError:
+        pass
+    
+    from chardet.universaldetector import UniversalDetector
+    
+    # One detector per thread (read_many reads from several), reset between files
+    local = threading.local()
+    
+    def detect(raw_data: bytes) -> Tuple[Optional[str], Optional[float]]:
+        detector = getattr(local, "detector", None)
+        if detector is None:
+            detector = local.detector = UniversalDetector()
+        else:
+            detector.reset()
+        # Feed in chunks and stop as soon as the detector is confident
+        view = memoryview(raw_data)
+        for start in range(0, len(view), _DETECT_CHUNK_SIZE):
+            detector.feed(view[start:start + _DETECT_CHUNK_SIZE])
+            if detector.done:
+                break
+        detected = detector.close()
+        return detected["encoding"], detected["confidence"]
+    return detect
+
+
+# Byte lookup table of the ASCII characters str.split() treats as whitespace
+_ASCII_WHITESPACE = np.zeros(256, dtype=bool)
+_ASCII_WHITESPACE[list(b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")] = True
+
+
+def _count_words(raw_data: bytes, content: str, encoding: str) -> int:
+    """
+    Count words the way len(content.split()) does.
+    
+    For pure-ASCII data in an ASCII-compatible encoding, words are counted as
+    whitespace-to-non-whitespace transitions over the raw bytes with NumPy,
+    which avoids allocating a string object per word.
+    
+    Args:
+        raw_data: The file bytes.
+        content: The decoded text.
+        encoding: The encoding content was decoded with.
+        
+    Returns:
+        The number of whitespace-separated words.
+    """
+    if not raw_data:
+        return 0
+    if codecs.lookup(encoding).name not in ("utf-8", "ascii") or not raw_data.isascii():
+        return len(content.split())
+    
+    is_space = _ASCII_WHITESPACE[np.frombuffer(raw_data, dtype=np.uint8)]
+    word_starts = np.count_nonzero(is_space[:-1] & ~is_space[1:])
+    return int(word_starts) + (not is_space[0])
 
 
 class TxtReader(BaseReader):
@@ -14,12 +112,41 @@ class TxtReader(BaseReader):
         """List of supported file extensions."""
         return [".txt", ".text"]
     
-    @error_handler(
-        error_type=ReadError,
-        message="Failed to read text file {args[0]}",
-        log_traceback=True,
-        raise_error=True
-    )
+    def read_many(
+        self,
+        file_paths: Iterable[Union[str, Path]],
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Document]:
+        """
+        Read many text files concurrently, yielding documents as they finish.
+        
+        Reading is I/O-bound and releases the GIL, so a thread pool overlaps the
+        reads. Results are yielded in completion order, not input order, so the
+        caller can start chunking the first documents while others are still read.
+        
+        Args:
+            file_paths: Paths to the text files.
+            max_workers: Maximum number of threads. Defaults to 4 per CPU, at most 32.
+            **kwargs: Additional parameters passed to read().
+            
+        Yields:
+            Document objects, one per file.
+            
+        Raises:
+            ReadError: If a file cannot be read. Files not yet started are cancelled.
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [executor.submit(self.read, file_path, **kwargs) for file_path in file_paths]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+    
     def _read_file(self, file_path: Path, **kwargs) -> Tuple[str, Optional[Dict[str, Any]]]:
         """
         Read the content of a text file.
@@ -28,35 +155,64 @@ class TxtReader(BaseReader):
             file_path: Path to the text file.
             **kwargs: Additional parameters, including:
                 - encoding: File encoding (default is instance encoding).
+                - normalize_newlines: Convert "\r\n" and "\r" to "\n" as text-mode
+                  open() does (default True). Pass False to keep the file's
+                  line endings and skip the extra pass over the content.
             
         Returns:
             A tuple containing:
                 - The text content as a string
                 - A dictionary with metadata like character and word counts
         """
-        encoding = kwargs.get("encoding", self.encoding)
-        
+        # Errors are handled inline rather than with the error_handler decorator,
+        # which would add a wrapper frame to every file read
         try:
-            with open(file_path, "r", encoding=encoding) as file:
-                content = file.read()
-        except UnicodeDecodeError:
-            # Try to detect encoding if specified encoding fails
-            self.logger.warning(f"Failed to decode {file_path} with {encoding} encoding, trying to detect encoding...")
-            import chardet
+            encoding = kwargs.get("encoding", self.encoding)
             
-            with open(file_path, "rb") as file:
-                raw_data = file.read()
-                detected = chardet.detect(raw_data)
-                detected_encoding = detected["encoding"]
+            # Read the whole file with a single open and decode in memory, so a failed
+            # decode does not need the file to be opened again
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                size = kwargs.get("_file_size")
+                if size is None:
+                    size = os.fstat(fd).st_size
+                raw_data = os.read(fd, size)
+                while len(raw_data) < size:
+                    chunk = os.read(fd, size - len(raw_data))
+                    if not chunk:
+                        break
+                    raw_data += chunk
+            finally:
+                os.close(fd)
+            
+            try:
+                content = raw_data.decode(encoding)
+                used_encoding = encoding
+            except UnicodeDecodeError:
+                # Try to detect encoding if specified encoding fails
+                self.logger.warning("Failed to decode %s with %s encoding, trying to detect encoding...", file_path, encoding)
+                detected_encoding, confidence = _encoding_detector()(raw_data)
+                
+                self.logger.info("Detected encoding: %s with confidence %s", detected_encoding, confidence)
                 
-            self.logger.info(f"Detected encoding: {detected_encoding} with confidence {detected['confidence']}")
+                used_encoding = detected_encoding or encoding
+                content = raw_data.decode(used_encoding)
             
-            with open(file_path, "r", encoding=detected_encoding) as file:
-                content = file.read()
-        
-        # Calculate additional metadata
-        word_count = len(content.split())
-        character_count = len(content)
+            # Match the newline translation of text-mode open(), in C-level str passes
+            if kwargs.get("normalize_newlines", True) and "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            
+            # Calculate additional metadata
+            word_count = _count_words(raw_data, content, used_encoding)
+            character_count = len(content)
+        except Exception as e:
+            handle_error(
+                ReadError,
+                f"Error in _read_file: Failed to read text file {file_path}",
+                original_error=e,
+                log_traceback=True,
+                raise_error=True
+            )
         
         additional_metadata = {
             "word_count": word_count,
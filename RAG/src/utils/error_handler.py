@@ -1,5 +1,6 @@
+import functools
+import logging
 import sys
-import traceback
 from typing import Any, Callable, Dict, Optional, Type, TypeVar, cast
 
 from .logger import logger
@@ -60,7 +61,8 @@ def handle_error(
     message: str,
     original_error: Optional[Exception] = None,
     log_traceback: bool = True,
-    raise_error: bool = True
+    raise_error: bool = True,
+    message_fn: Optional[Callable[[], str]] = None
 ) -> None:
     """
     Handle an error in a standardized way.
@@ -71,17 +73,29 @@ def handle_error(
         original_error: The original exception that caused this error.
         log_traceback: Whether to log the traceback.
         raise_error: Whether to raise the error after logging.
+        message_fn: Optional function building the full error message. It is only
+            called if the message is needed (the error is raised or logged), and
+            its result replaces message.
     
     Raises:
         PipelineError: The wrapped error if raise_error is True.
     """
+    if message_fn is not None:
+        # Nothing would use the message if it is neither raised nor logged
+        if not raise_error and not logger.isEnabledFor(logging.ERROR):
+            return
+        message = message_fn()
+    
     error = error_type(message, original_error)
     
     # Log the error
     if log_traceback and original_error:
+        # The traceback is only formatted if the record is actually emitted
         logger.error(
-            f"{message} - Original error: {str(original_error)}\n"
-            f"{''.join(traceback.format_exception(type(original_error), original_error, original_error.__traceback__))}"
+            "%s - Original error: %s",
+            message,
+            original_error,
+            exc_info=(type(original_error), original_error, original_error.__traceback__)
         )
     else:
         logger.error(message)
@@ -109,25 +123,28 @@ def error_handler(
         Decorated function that handles errors.
     """
     def decorator(func: Callable[..., R]) -> Callable[..., R]:
+        @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> R:
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                # Format the message with args and kwargs if possible
-                try:
-                    formatted_message = message.format(args=args, kwargs=kwargs)
-                except (KeyError, ValueError):
-                    formatted_message = message
-                
-                # Include the function name in the message
-                full_message = f"Error in {func.__name__}: {formatted_message}"
+                def build_message() -> str:
+                    # Format the message with args and kwargs if possible
+                    try:
+                        formatted_message = message.format(args=args, kwargs=kwargs)
+                    except (KeyError, ValueError):
+                        formatted_message = message
+                    
+                    # Include the function name in the message
+                    return f"Error in {func.__name__}: {formatted_message}"
                 
                 handle_error(
                     error_type,
-                    full_message,
+                    message,
                     original_error=e,
                     log_traceback=log_traceback,
-                    raise_error=raise_error
+                    raise_error=raise_error,
+                    message_fn=build_message
                 )
                 
                 # This will only be reached if raise_error is False
@@ -169,14 +186,13 @@ def safe_execute(
     try:
         return func(*args, **kwargs)
     except Exception as e:
-        full_message = f"Error executing {func.__name__}: {message}"
-        
         handle_error(
             error_type,
-            full_message,
+            message,
             original_error=e,
             log_traceback=log_traceback,
-            raise_error=raise_error
+            raise_error=raise_error,
+            message_fn=lambda: f"Error executing {func.__name__}: {message}"
         )
         
         return default_return
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Lightweight file stat for the reader hot path.
+
+On Linux the statx(2) system call is used directly through ctypes, requesting
+only the type, size and modification time of the file and allowing cached
+attributes to be returned without syncing with the filesystem. Elsewhere, or
+when statx is unavailable (glibc < 2.28, kernel < 4.11), it falls back to os.stat.
+"""
+
+import ctypes
+import errno
+import functools
+import os
+import sys
+from typing import Callable, NamedTuple, Optional, Union
+from pathlib import Path
+
+
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_MTIME = 0x0040
+_STATX_SIZE = 0x0200
+_STATX_MASK = _STATX_TYPE | _STATX_MTIME | _STATX_SIZE
+
+# Set when libc has statx but the kernel does not (ENOSYS)
+_statx_unsupported = False
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """Mirror of struct statx from <linux/stat.h> (256 bytes)."""
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("_spare2", ctypes.c_uint64 * 14),
+    ]
+
+
+class FastStat(NamedTuple):
+    """
+    The subset of stat information the readers use.
+
+    Field names match os.stat_result so either can be passed where only these
+    attributes are read.
+    """
+    st_size: int
+    st_mtime_ns: int
+    st_mode: int
+
+    @property
+    def st_mtime(self) -> float:
+        """Modification time in seconds, as on os.stat_result."""
+        return self.st_mtime_ns / 1e9
+
+
+@functools.lru_cache(maxsize=None)
+def _libc_statx() -> Optional[Callable[..., int]]:
+    """
+    Look up statx in libc once per process.
+
+    Returns:
+        The ctypes function, or None if this platform does not provide it.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        statx = ctypes.CDLL("libc.so.6", use_errno=True).statx
+    except (OSError, AttributeError):
+        return None
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(_Statx)]
+    statx.restype = ctypes.c_int
+    return statx
+
+
+def fast_stat(path: Union[str, Path]) -> FastStat:
+    """
+    Get the size, modification time and mode of a file.
+
+    Symlinks are followed, as with os.stat.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        A FastStat tuple of (size, mtime_ns, mode).
+
+    Raises:
+        OSError: If the file cannot be stat-ed (FileNotFoundError if it does not exist).
+    """
+    global _statx_unsupported
+    statx = None if _statx_unsupported else _libc_statx()
+    if statx is not None:
+        buf = _Statx()
+        if statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC, _STATX_MASK, ctypes.byref(buf)) == 0:
+            mtime = buf.stx_mtime
+            return FastStat(buf.stx_size, mtime.tv_sec * 1_000_000_000 + mtime.tv_nsec, buf.stx_mode)
+
+        err = ctypes.get_errno()
+        if err != errno.ENOSYS:
+            raise OSError(err, os.strerror(err), os.fspath(path))
+        _statx_unsupported = True
+
+    st = os.stat(path)
+    return FastStat(st.st_size, st.st_mtime_ns, st.st_mode)
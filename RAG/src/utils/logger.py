@@ -1,11 +1,19 @@
 # src/utils/logger.py
 import logging
-import sys
 from pathlib import Path
 from typing import Optional, Union
 
 from ..config.settings import settings
 
+# Shared by the file handlers the pipeline loggers install
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Configured level, parsed once; strips any inline comment from the environment variable
+_LEVEL = getattr(logging, (settings.LOG_LEVEL or 'INFO').split('#')[0].strip())
+
 class PipelineLogger:
     """Custom logger for the data processing pipeline."""
     
@@ -26,33 +34,32 @@ class PipelineLogger:
         self.logger = logging.getLogger(name)
         
         # Set log level - strip any comments that might be in the environment variable
-        log_level = log_level or settings.LOG_LEVEL  # Changed from loglevel to LOG_LEVEL
         if log_level:
             # Extract just the level name (strip any comments)
-            log_level = log_level.split('#')[0].strip()
-            
-        self.logger.setLevel(getattr(logging, log_level))
+            self.logger.setLevel(getattr(logging, log_level.split('#')[0].strip()))
+        else:
+            self.logger.setLevel(_LEVEL)
         
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        # Records propagate to the root handlers set up by settings, which write them
+        # to the console and to the pipeline log file, so no console handler is added
         
-        # Create console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        # Another instance with the same name already installed the handlers
+        if self.logger.handlers:
+            return
         
-        # Create file handler if log file is specified
+        # Create an extra file handler if log file is specified
         log_file = log_file or settings.get('LOG_FILE')  # Use get method with proper capitalization
         if log_file:
             log_path = Path(log_file)
             log_path.parent.mkdir(parents=True, exist_ok=True)
             file_handler = logging.FileHandler(log_path)
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(_FORMATTER)
             self.logger.addHandler(file_handler)
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message of the given level would be emitted."""
+        return self.logger.isEnabledFor(level)
+    
     def debug(self, message: str, *args, **kwargs):
         """Log a debug message."""
         self.logger.debug(message, *args, **kwargs)
@@ -0,0 +1,273 @@
+"""
+SQLite-backed state manager for tracking the processing state of files in the pipeline.
+
+Each file stage update is a single-row upsert in a SQLite database in WAL mode,
+instead of a journal record that is periodically folded into a JSON snapshot.
+"""
+
+import atexit
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..config.settings import LOGS_DIR
+from ..utils.logger import logger
+from .state_manager import StateManager, _dumps_compact, _loads
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_stages (
+    file_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    error TEXT,
+    ts TEXT NOT NULL,
+    PRIMARY KEY (file_id, stage)
+);
+CREATE TABLE IF NOT EXISTS file_meta (
+    file_id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    last_modified TEXT NOT NULL,
+    metadata BLOB
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at TEXT,
+    completed_at TEXT,
+    status TEXT,
+    summary BLOB
+);
+"""
+
+_UPSERT_STAGE = "INSERT OR REPLACE INTO file_stages (file_id, stage, success, error, ts) VALUES (?, ?, ?, ?, ?)"
+
+# Used when saving everything, so the file's original started_at is rewritten as well
+_REPLACE_META = "INSERT OR REPLACE INTO file_meta (file_id, started_at, last_modified, metadata) VALUES (?, ?, ?, ?)"
+
+_UPSERT_META = (
+    "INSERT INTO file_meta (file_id, started_at, last_modified, metadata) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(file_id) DO UPDATE SET last_modified = excluded.last_modified, metadata = excluded.metadata"
+)
+
+_UPSERT_RUN = (
+    "INSERT INTO runs (run_id, started_at, completed_at, status, summary) VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT(run_id) DO UPDATE SET started_at = excluded.started_at, completed_at = excluded.completed_at, "
+    "status = excluded.status, summary = excluded.summary"
+)
+
+# Rows whose key is not in a JSON array of the keys held in memory
+_DELETE_STALE_STAGES = "DELETE FROM file_stages WHERE file_id NOT IN (SELECT value FROM json_each(?))"
+_DELETE_STALE_META = "DELETE FROM file_meta WHERE file_id NOT IN (SELECT value FROM json_each(?))"
+_DELETE_STALE_RUNS = "DELETE FROM runs WHERE run_id NOT IN (SELECT value FROM json_each(?))"
+
+
+class SQLiteStateManager(StateManager):
+    """
+    State manager that persists file states and pipeline runs in SQLite.
+
+    The state is still held in memory, as in StateManager, so progress queries and
+    the failed/successful file indexes work unchanged. The database has three tables:
+    file_stages (one row per file and stage), file_meta (one row per file) and runs
+    (one row per pipeline run).
+
+    When a new database is first opened, the state of the JSON-backed StateManager
+    is imported into it, if its state file exists.
+    """
+
+    def __init__(self, state_file: Optional[str] = None, json_state_file: Optional[str] = None):
+        """
+        Initialize the state manager.
+
+        Args:
+            state_file: Path to the SQLite database. If None, defaults to
+                pipeline_state.db in the logs directory.
+            json_state_file: State file of the JSON-backed StateManager to import
+                when the database is empty, so files it recorded are not processed
+                again. If None, defaults to the database path with a .json suffix.
+        """
+        self._conn: Optional[sqlite3.Connection] = None
+        state_file = state_file or str(LOGS_DIR / "pipeline_state.db")
+        self.json_state_file = json_state_file or str(Path(state_file).with_suffix(".json"))
+        super().__init__(state_file=state_file)
+
+    def _load_state(self) -> None:
+        """Open the database, creating its tables if needed, and load the state from it."""
+        Path(self.state_file).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.state_file)
+        # WAL with synchronous=NORMAL commits without an fsync per transaction
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        # user_version marks a database that has been checked for a JSON state to
+        # import, so a state emptied by reset_state is not imported again
+        first_open = self._conn.execute("PRAGMA user_version").fetchone()[0] == 0
+        if first_open:
+            with self._conn:
+                self._conn.execute("PRAGMA user_version = 1")
+            if self._is_empty() and os.path.exists(self.json_state_file):
+                self._import_json_state()
+                return
+
+        files: Dict[str, Dict[str, Any]] = {}
+        for file_id, started_at, last_modified, metadata in self._conn.execute(
+            "SELECT file_id, started_at, last_modified, metadata FROM file_meta"
+        ):
+            file_state = files[file_id] = {"started_at": started_at, "stages": {}}
+            if metadata is not None:
+                file_state["metadata"] = _loads(metadata)
+            file_state["last_modified"] = last_modified
+
+        for file_id, stage, success, error, ts in self._conn.execute(
+            "SELECT file_id, stage, success, error, ts FROM file_stages ORDER BY rowid"
+        ):
+            file_state = files.get(file_id)
+            if file_state is None:
+                continue
+            stage_info = {"success": bool(success), "timestamp": ts}
+            if error:
+                stage_info["error"] = error
+            file_state["stages"][stage] = stage_info
+
+        runs: Dict[str, Dict[str, Any]] = {}
+        for run_id, started_at, completed_at, status, summary in self._conn.execute(
+            "SELECT run_id, started_at, completed_at, status, summary FROM runs ORDER BY started_at, rowid"
+        ):
+            run: Dict[str, Any] = {"started_at": started_at, "status": status}
+            if completed_at is not None:
+                run["completed_at"] = completed_at
+            if summary is not None:
+                run["summary"] = _loads(summary)
+            runs[run_id] = run
+
+        # The current run is the one started last
+        last_run = self._conn.execute(
+            "SELECT run_id FROM runs ORDER BY started_at DESC, rowid DESC LIMIT 1"
+        ).fetchone()
+
+        self.files = files
+        self.pipeline_metadata = {"runs": runs, "current_run": last_run[0]} if last_run else {}
+        self._rebuild_indexes()
+        logger.debug("Loaded state from %s", self.state_file)
+
+    def _is_empty(self) -> bool:
+        """Check whether the database holds no file states and no runs."""
+        return not self._conn.execute(
+            "SELECT EXISTS (SELECT 1 FROM file_meta) OR EXISTS (SELECT 1 FROM runs)"
+        ).fetchone()[0]
+
+    def _import_json_state(self) -> None:
+        """Copy the file states and runs of the JSON-backed state manager into the database."""
+        json_state = StateManager(state_file=self.json_state_file)
+        # Only read here; its journal is already folded in and must not be flushed at exit
+        atexit.unregister(json_state.flush)
+
+        self.files = json_state.files
+        self.pipeline_metadata = json_state.pipeline_metadata
+        self._rebuild_indexes()
+        self._save_state()
+        self._save_runs()
+        logger.info(
+            f"Imported the state of {len(self.files)} files from {self.json_state_file} into {self.state_file}"
+        )
+
+    def _save_state(self) -> None:
+        """Write all file states from memory to the database, removing files no longer held."""
+        stage_rows = []
+        meta_rows = []
+        for file_id, file_state in self.files.items():
+            metadata = file_state.get("metadata")
+            meta_rows.append((
+                file_id,
+                file_state["started_at"],
+                file_state["last_modified"],
+                _dumps_compact(metadata) if metadata is not None else None
+            ))
+            for stage, stage_info in file_state["stages"].items():
+                stage_rows.append((
+                    file_id,
+                    stage,
+                    int(stage_info["success"]),
+                    stage_info.get("error"),
+                    stage_info["timestamp"]
+                ))
+
+        try:
+            with self._conn:
+                file_ids = _dumps_compact(list(self.files)).decode()
+                self._conn.execute(_DELETE_STALE_STAGES, (file_ids,))
+                self._conn.execute(_DELETE_STALE_META, (file_ids,))
+                self._conn.executemany(_REPLACE_META, meta_rows)
+                self._conn.executemany(_UPSERT_STAGE, stage_rows)
+            logger.debug("Saved state to %s", self.state_file)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to save state to {self.state_file}: {str(e)}")
+
+    def _save_runs(self) -> None:
+        """Write the pipeline runs from memory to the database, removing runs no longer held."""
+        runs = self.pipeline_metadata.get("runs", {})
+        rows = [
+            (
+                run_id,
+                run.get("started_at"),
+                run.get("completed_at"),
+                run.get("status"),
+                _dumps_compact(run["summary"]) if "summary" in run else None
+            )
+            for run_id, run in runs.items()
+        ]
+        try:
+            with self._conn:
+                self._conn.execute(_DELETE_STALE_RUNS, (_dumps_compact(list(runs)).decode(),))
+                self._conn.executemany(_UPSERT_RUN, rows)
+            logger.debug("Saved pipeline runs to %s", self.state_file)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to save pipeline runs to {self.state_file}: {str(e)}")
+
+    def update_file_state(
+        self,
+        file_id: str,
+        stage: str,
+        success: bool,
+        error: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Update the state of a file for a specific processing stage.
+
+        Only the file's row for this stage and its file_meta row are written.
+
+        Args:
+            file_id: Unique identifier for the file.
+            stage: Processing stage (e.g., "read", "processed", "chunked").
+            success: Whether the stage completed successfully.
+            error: Error message if success is False.
+            metadata: Additional metadata to store.
+        """
+        timestamp = datetime.now().isoformat()
+        self._apply_file_update(file_id, stage, success, error, metadata, timestamp)
+
+        file_state = self.files[file_id]
+        merged_metadata = file_state.get("metadata")
+        try:
+            with self._conn:
+                self._conn.execute(_UPSERT_STAGE, (file_id, stage, int(success), error or None, timestamp))
+                self._conn.execute(_UPSERT_META, (
+                    file_id,
+                    file_state["started_at"],
+                    timestamp,
+                    _dumps_compact(merged_metadata) if merged_metadata is not None else None
+                ))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to save state of {file_id} to {self.state_file}: {str(e)}")
+
+    def flush(self) -> None:
+        """Nothing to do; every update is committed as it is made."""
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -6,16 +6,85 @@ through the various stages of the pipeline, enabling monitoring, reporting, and
 recovery from failures.
 """
 
+import atexit
 import json
 import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..config.settings import settings
 from ..utils.logger import logger
 
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library
+    orjson = None
+
+
+# Buffer size for reading and writing the state files, instead of the 8 KiB default
+_IO_BUFFER_SIZE = 1 << 20
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize state to JSON bytes, compact unless pretty is set, with orjson when available."""
+    if not pretty:
+        return _dumps_compact(obj)
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    """Serialize a value to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize a journal record to one line of compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON state, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """
+    Write data to a file atomically.
+    
+    The data is written to a temporary file which is renamed over the target, so a
+    crash mid-write leaves the previous contents intact instead of a truncated file.
+    
+    Args:
+        path: Path to the file to write.
+        data: Bytes to write.
+        
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    tmp_file = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_file, "wb", buffering=_IO_BUFFER_SIZE) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    except BaseException:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
 
 class StateManager:
     """
@@ -25,44 +94,208 @@ class StateManager:
     tracking which stages have been completed and any errors encountered.
     """
     
-    def __init__(self, state_file: Optional[str] = None):
+    # Stages a file goes through, in order
+    EXPECTED_STAGES: Tuple[str, ...] = ("read", "processed", "chunked", "embedded", "loaded")
+    NUM_STAGES: int = len(EXPECTED_STAGES)
+    
+    # File statuses reported by get_file_progress
+    STATUS_COMPLETED = "completed"
+    STATUS_IN_PROGRESS = "in_progress"
+    STATUS_NOT_STARTED = "not_started"
+    STATUS_UNKNOWN = "unknown"
+    FAILED_STATUS_PREFIX = "failed_at_"
+    FAILED_STATUSES: Dict[str, str] = dict(zip(EXPECTED_STAGES, map(FAILED_STATUS_PREFIX.__add__, EXPECTED_STAGES)))
+    
+    def __init__(
+        self,
+        state_file: Optional[str] = None,
+        compact_every_n: int = 1000,
+        pretty: bool = False
+    ):
         """
         Initialize the state manager.
         
+        The file states are persisted as a JSON snapshot plus an append-only journal
+        (<state file stem>.journal.jsonl) with one line per file state update, so
+        an update writes only its own record. The journal is folded into the
+        snapshot every compact_every_n records, on flush() and at interpreter exit.
+        Pipeline run metadata is kept in its own small file (<state file stem>.runs.json),
+        so recording a run start or completion does not rewrite the file states.
+        
         Args:
             state_file: Path to the state file. If None, defaults to a file in the logs directory.
+            compact_every_n: Number of journal records after which the snapshot is rewritten.
+            pretty: Whether to write the state and runs files as indented JSON, for
+                inspecting them by hand. Compact JSON is smaller and faster to write.
         """
         self.state_file = state_file or str(settings.logs_dir / "pipeline_state.json")
-        self.state: Dict[str, Dict[str, Any]] = {}
+        self.journal_file = str(Path(self.state_file).with_suffix(".journal.jsonl"))
+        self.runs_file = str(Path(self.state_file).with_suffix(".runs.json"))
+        # Per-file records, keyed by file ID
+        self.files: Dict[str, Dict[str, Any]] = {}
+        # Pipeline run bookkeeping, kept apart so it is never iterated as a file
+        self.pipeline_metadata: Dict[str, Any] = {}
+        self.compact_every_n = compact_every_n
+        self.pretty = pretty
+        # get_file_progress results; an entry is recomputed whenever its file is updated
+        self._progress_cache: Dict[str, Dict[str, Any]] = {}
+        # Status indexes kept up to date on every update, so the failed/successful
+        # file queries don't rescan the whole state. Dicts with None values are
+        # used as insertion-ordered sets.
+        self._failed: Dict[str, None] = {}
+        self._completed: Dict[str, None] = {}
+        self._in_progress: Dict[str, None] = {}
+        self._journal = None
+        self._journal_entries = 0
         self._load_state()
+        atexit.register(self.flush)
     
     def _load_state(self) -> None:
-        """Load the state from the state file if it exists."""
+        """Load the state and run metadata files if they exist, then replay the journal."""
         state_path = Path(self.state_file)
         
         if state_path.exists():
             try:
-                with open(state_path, "r") as f:
-                    self.state = json.load(f)
-                logger.debug(f"Loaded state from {self.state_file}")
+                with open(state_path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+                    state = _loads(f.read())
+                if "files" in state:
+                    self.files = state["files"]
+                    self.pipeline_metadata = state.get("pipeline_metadata") or {}
+                else:
+                    # Older flat layout with pipeline metadata stored as a pseudo-file
+                    self.pipeline_metadata = state.pop("pipeline_metadata", None) or {}
+                    self.files = state
+                logger.debug("Loaded state from %s", self.state_file)
             except Exception as e:
                 logger.warning(f"Failed to load state from {self.state_file}: {str(e)}")
                 # Initialize with empty state
-                self.state = {}
+                self.files = {}
+                self.pipeline_metadata = {}
         else:
             # Ensure the directory exists
             state_path.parent.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"State file {self.state_file} does not exist, starting with empty state")
-            self.state = {}
+            logger.debug("State file %s does not exist, starting with empty state", self.state_file)
+            self.files = {}
+            self.pipeline_metadata = {}
+        
+        # Run metadata saved separately takes precedence over any in the state file
+        if os.path.exists(self.runs_file):
+            try:
+                with open(self.runs_file, "rb") as f:
+                    self.pipeline_metadata = _loads(f.read())
+            except Exception as e:
+                logger.warning(f"Failed to load pipeline runs from {self.runs_file}: {str(e)}")
+        elif self.pipeline_metadata:
+            # Move run metadata from an older state file into its own file, as the
+            # state file no longer stores it
+            self._save_runs()
+        
+        self._rebuild_indexes()
+        self._replay_journal()
+    
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the progress cache and status indexes from the loaded state."""
+        self._progress_cache.clear()
+        self._failed.clear()
+        self._completed.clear()
+        self._in_progress.clear()
+        for file_id, file_state in self.files.items():
+            self._index_file(file_id, file_state)
+    
+    def _index_file(self, file_id: str, file_state: Dict[str, Any]) -> None:
+        """Recompute a file's progress and move it to the matching status indexes."""
+        # A file is reported as failed if any stage failed, expected or not
+        if any(not stage_info.get("success", True) for stage_info in file_state["stages"].values()):
+            self._failed[file_id] = None
+        else:
+            self._failed.pop(file_id, None)
+        
+        progress = self._progress_cache[file_id] = self._compute_file_progress(file_id, file_state)
+        status = progress["status"]
+        if status == self.STATUS_COMPLETED:
+            self._completed[file_id] = None
+            self._in_progress.pop(file_id, None)
+        elif status == self.STATUS_IN_PROGRESS:
+            self._in_progress[file_id] = None
+            self._completed.pop(file_id, None)
+        else:
+            self._completed.pop(file_id, None)
+            self._in_progress.pop(file_id, None)
+    
+    def _replay_journal(self) -> None:
+        """Apply updates recorded in the journal since the last snapshot."""
+        if not os.path.exists(self.journal_file):
+            return
+        
+        replayed = 0
+        torn = False
+        with open(self.journal_file, "rb", buffering=_IO_BUFFER_SIZE) as f:
+            for line in f:
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    # A torn last line from an interrupted write
+                    logger.warning(f"Skipping unreadable journal record in {self.journal_file}")
+                    torn = True
+                    continue
+                self._apply_file_update(**record)
+                replayed += 1
+        
+        self._journal_entries = replayed
+        logger.debug("Replayed %d journal records from %s", replayed, self.journal_file)
+        
+        # Don't append new records after a torn line; start a fresh journal
+        if torn:
+            self._save_state()
     
     def _save_state(self) -> None:
-        """Save the current state to the state file."""
+        """Save the file states to the state file and clear the journal it now includes."""
         try:
-            with open(self.state_file, "w") as f:
-                json.dump(self.state, f, indent=2)
-            logger.debug(f"Saved state to {self.state_file}")
+            _write_atomic(self.state_file, _dumps({"files": self.files}, self.pretty))
+            logger.debug("Saved state to %s", self.state_file)
         except Exception as e:
             logger.error(f"Failed to save state to {self.state_file}: {str(e)}")
+            return
+        
+        # Replaying the journal is idempotent, so a crash before this point is harmless
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        try:
+            os.remove(self.journal_file)
+        except FileNotFoundError:
+            pass
+        self._journal_entries = 0
+    
+    def _save_runs(self) -> None:
+        """Save the pipeline run metadata to the runs file."""
+        try:
+            _write_atomic(self.runs_file, _dumps(self.pipeline_metadata, self.pretty))
+            logger.debug("Saved pipeline runs to %s", self.runs_file)
+        except Exception as e:
+            logger.error(f"Failed to save pipeline runs to {self.runs_file}: {str(e)}")
+    
+    def _append_journal(self, record: Dict[str, Any]) -> None:
+        """Append one update record to the journal."""
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_file, "ab")
+            self._journal.write(_dumps_line(record))
+            self._journal.flush()
+        except Exception as e:
+            logger.error(f"Failed to append to state journal {self.journal_file}: {str(e)}")
+            # Fall back to a full snapshot so the update is not lost
+            self._save_state()
+            return
+        
+        self._journal_entries += 1
+        if self._journal_entries >= self.compact_every_n:
+            self._save_state()
+    
+    def flush(self) -> None:
+        """Fold the journal into the state file, if it has any records."""
+        if self._journal_entries:
+            self._save_state()
     
     def get_file_state(self, file_id: str) -> Dict[str, Any]:
         """
@@ -74,7 +307,7 @@ class StateManager:
         Returns:
             Dictionary containing the state of the file.
         """
-        return self.state.get(file_id, {})
+        return self.files.get(file_id, {})
     
     def update_file_state(
         self, 
@@ -94,34 +327,55 @@ class StateManager:
             error: Error message if success is False.
             metadata: Additional metadata to store.
         """
+        # One timestamp serves started_at, the stage timestamp and last_modified
+        timestamp = datetime.now().isoformat()
+        self._apply_file_update(file_id, stage, success, error, metadata, timestamp)
+        
+        # Record the update in the journal instead of rewriting the whole state
+        self._append_journal({
+            "file_id": file_id,
+            "stage": stage,
+            "success": success,
+            "error": error,
+            "metadata": metadata,
+            "timestamp": timestamp
+        })
+    
+    def _apply_file_update(
+        self,
+        file_id: str,
+        stage: str,
+        success: bool,
+        error: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        timestamp: str
+    ) -> None:
+        """Apply a file stage update to the in-memory state (also used for journal replay)."""
         # Initialize file state if not exists
-        if file_id not in self.state:
-            self.state[file_id] = {
-                "started_at": datetime.now().isoformat(),
+        file_state = self.files.get(file_id)
+        if file_state is None:
+            file_state = self.files[file_id] = {
+                "started_at": timestamp,
                 "stages": {}
             }
         
-        # Update stage information
-        self.state[file_id]["stages"][stage] = {
+        # Update stage information, with error information if provided
+        stage_info = {
             "success": success,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
-        
-        # Add error information if provided
         if error:
-            self.state[file_id]["stages"][stage]["error"] = error
+            stage_info["error"] = error
+        file_state["stages"][stage] = stage_info
         
         # Add metadata if provided
         if metadata:
-            if "metadata" not in self.state[file_id]:
-                self.state[file_id]["metadata"] = {}
-            self.state[file_id]["metadata"].update(metadata)
+            file_state.setdefault("metadata", {}).update(metadata)
         
         # Update last modified timestamp
-        self.state[file_id]["last_modified"] = datetime.now().isoformat()
+        file_state["last_modified"] = timestamp
         
-        # Save the updated state
-        self._save_state()
+        self._index_file(file_id, file_state)
     
     def get_file_progress(self, file_id: str) -> Dict[str, Any]:
         """
@@ -131,52 +385,60 @@ class StateManager:
             file_id: Unique identifier for the file.
             
         Returns:
-            Dictionary containing the progress information.
+            Dictionary containing the progress information. Results are cached until
+            the file is next updated, so the returned dictionary must not be modified.
         """
+        progress = self._progress_cache.get(file_id)
+        if progress is not None:
+            return progress
+        
         file_state = self.get_file_state(file_id)
         
         if not file_state:
-            return {"file_id": file_id, "status": "unknown", "progress": 0}
-        
-        # Define expected stages in order
-        expected_stages = ["read", "processed", "chunked", "embedded", "loaded"]
+            return {"file_id": file_id, "status": self.STATUS_UNKNOWN, "progress": 0}
         
+        progress = self._progress_cache[file_id] = self._compute_file_progress(file_id, file_state)
+        return progress
+    
+    def _compute_file_progress(self, file_id: str, file_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute the progress information for a file from its state."""
         # Count completed stages
         completed_stages = 0
         failed_stage = None
+        stages = file_state.get("stages") or {}
         
-        for stage in expected_stages:
-            stage_info = file_state.get("stages", {}).get(stage, {})
+        for stage in self.EXPECTED_STAGES:
+            stage_info = stages.get(stage)
             
-            if stage_info.get("success", False):
+            if stage_info is None:
+                # Stage not yet attempted
+                break
+            elif stage_info.get("success"):
                 completed_stages += 1
-            elif stage in file_state.get("stages", {}):
+            else:
                 # Stage was attempted but failed
                 failed_stage = stage
                 break
-            else:
-                # Stage not yet attempted
-                break
         
         # Calculate progress percentage
-        progress = (completed_stages / len(expected_stages)) * 100
+        progress = (completed_stages / self.NUM_STAGES) * 100
         
         # Determine overall status
         if failed_stage:
-            status = f"failed_at_{failed_stage}"
-        elif completed_stages == len(expected_stages):
-            status = "completed"
+            status = self.FAILED_STATUSES[failed_stage]
+        elif completed_stages == self.NUM_STAGES:
+            status = self.STATUS_COMPLETED
         elif completed_stages == 0:
-            status = "not_started"
+            status = self.STATUS_NOT_STARTED
         else:
-            status = "in_progress"
+            status = self.STATUS_IN_PROGRESS
         
         return {
             "file_id": file_id,
             "status": status,
             "progress": progress,
             "completed_stages": completed_stages,
-            "total_stages": len(expected_stages),
+            "total_stages": self.NUM_STAGES,
             "started_at": file_state.get("started_at"),
             "last_modified": file_state.get("last_modified")
         }
@@ -188,34 +450,31 @@ class StateManager:
         Returns:
             Dictionary containing the summary information.
         """
-        total_files = len(self.state)
+        total_files = 0
         completed_files = 0
         failed_files = 0
         in_progress_files = 0
         not_started_files = 0
+        total_progress = 0.0
         
-        # Count files by status
-        for file_id in self.state:
+        # Count files by status and accumulate progress in a single pass
+        for file_id in self.files:
             progress = self.get_file_progress(file_id)
-            status = progress.get("status", "")
+            total_files += 1
+            total_progress += progress["progress"]
+            status = progress["status"]
             
-            if status == "completed":
+            if status == self.STATUS_COMPLETED:
                 completed_files += 1
-            elif status.startswith("failed"):
+            elif status.startswith(self.FAILED_STATUS_PREFIX):
                 failed_files += 1
-            elif status == "in_progress":
+            elif status == self.STATUS_IN_PROGRESS:
                 in_progress_files += 1
-            elif status == "not_started":
+            elif status == self.STATUS_NOT_STARTED:
                 not_started_files += 1
         
         # Calculate overall progress
-        overall_progress = 0
-        if total_files > 0:
-            file_progresses = [
-                self.get_file_progress(file_id).get("progress", 0)
-                for file_id in self.state
-            ]
-            overall_progress = sum(file_progresses) / total_files
+        overall_progress = total_progress / total_files if total_files > 0 else 0
         
         return {
             "total_files": total_files,
@@ -240,24 +499,17 @@ class StateManager:
         if run_id is None:
             run_id = f"run_{int(time.time())}"
         
-        # Create or update pipeline metadata
-        if "pipeline_metadata" not in self.state:
-            self.state["pipeline_metadata"] = {}
-        
-        if "runs" not in self.state["pipeline_metadata"]:
-            self.state["pipeline_metadata"]["runs"] = {}
-        
         # Record run start
-        self.state["pipeline_metadata"]["runs"][run_id] = {
+        self.pipeline_metadata.setdefault("runs", {})[run_id] = {
             "started_at": datetime.now().isoformat(),
             "status": "running"
         }
         
         # Update current run
-        self.state["pipeline_metadata"]["current_run"] = run_id
+        self.pipeline_metadata["current_run"] = run_id
         
-        # Save state
-        self._save_state()
+        # Save the run metadata only; the file states are unchanged
+        self._save_runs()
         
         return run_id
     
@@ -271,36 +523,37 @@ class StateManager:
         """
         # Get current run if run_id not provided
         if run_id is None:
-            run_id = self.state.get("pipeline_metadata", {}).get("current_run")
+            run_id = self.pipeline_metadata.get("current_run")
         
         if run_id is None:
             logger.warning("Cannot mark pipeline completed: no run ID provided and no current run found")
             return
         
         # Update run status
-        if (
-            "pipeline_metadata" in self.state
-            and "runs" in self.state["pipeline_metadata"]
-            and run_id in self.state["pipeline_metadata"]["runs"]
-        ):
-            self.state["pipeline_metadata"]["runs"][run_id].update({
+        run = self.pipeline_metadata.get("runs", {}).get(run_id)
+        if run is not None:
+            run.update({
                 "completed_at": datetime.now().isoformat(),
                 "status": "success" if success else "failed"
             })
             
             # Add summary if available
             summary = self.get_pipeline_summary()
-            self.state["pipeline_metadata"]["runs"][run_id]["summary"] = summary
+            run["summary"] = summary
             
-            # Save state
-            self._save_state()
+            self._save_runs()
+            # Checkpoint the run's file updates: fold the journal into the snapshot
+            self.flush()
         else:
             logger.warning(f"Cannot mark pipeline completed: run {run_id} not found")
     
     def reset_state(self) -> None:
         """Reset the state to empty and save."""
-        self.state = {}
+        self.files = {}
+        self.pipeline_metadata = {}
+        self._rebuild_indexes()
         self._save_state()
+        self._save_runs()
     
     def get_failed_files(self) -> List[Dict[str, Any]]:
         """
@@ -311,13 +564,9 @@ class StateManager:
         """
         failed_files = []
         
-        for file_id, file_state in self.state.items():
-            # Skip pipeline metadata
-            if file_id == "pipeline_metadata":
-                continue
-                
-            # Check each stage for failures
-            for stage, stage_info in file_state.get("stages", {}).items():
+        for file_id in self._failed:
+            # Record the first failed stage of each file
+            for stage, stage_info in self.files[file_id]["stages"].items():
                 if not stage_info.get("success", True):
                     failed_files.append({
                         "file_id": file_id,
@@ -325,7 +574,6 @@ class StateManager:
                         "error": stage_info.get("error", "Unknown error"),
                         "timestamp": stage_info.get("timestamp")
                     })
-                    # Only record the first failure for each file
                     break
         
         return failed_files
@@ -337,15 +585,4 @@ class StateManager:
         Returns:
             List of file IDs that completed processing.
         """
-        successful_files = []
-        
-        for file_id in self.state:
-            # Skip pipeline metadata
-            if file_id == "pipeline_metadata":
-                continue
-                
-            progress = self.get_file_progress(file_id)
-            if progress.get("status") == "completed":
-                successful_files.append(file_id)
-        
-        return successful_files
\ No newline at end of file
+        return list(self._completed)
\ No newline at end of file
@@ -11,7 +11,12 @@ from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 
 # Add pprint for better debugging
 from pprint import pprint
+import asyncio
+import functools
+import io
+import json
 import os
+import sys
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -19,6 +24,8 @@ load_dotenv()
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
 
 # MODEL
+# Cached so every caller shares one client and its HTTP connection pool
+@functools.lru_cache(maxsize=1)
 def call_model():
     return ChatAnthropic(model="claude-3-5-sonnet-latest", anthropic_api_key=ANTHROPIC_API_KEY)
 
@@ -48,49 +55,116 @@ async def single_server():
                 pprint(m)
 
 
-def extract_ai_messages(messages):
-    ai_messages = []
-    for m in messages:
-        if isinstance(m, AIMessage):
-            ai_content = []
-            if isinstance(m.content, list):
-                for item in m.content:
-                    if isinstance(item, dict) and 'text' in item:
-                        ai_content.append(item['text'])
-            elif isinstance(m.content, str):
-                ai_content.append(m.content)
-            ai_messages.append({'AI Message': ai_content})
-    return ai_messages
+def _content_texts(content):
+    """Return the text parts of a message's content, which is a string or a list of content blocks."""
+    if isinstance(content, str):
+        return [content]
+    if isinstance(content, list):
+        return [item['text'] for item in content if isinstance(item, dict) and 'text' in item]
+    return []
 
-def extract_tool_messages(messages):
-    tool_messages = []
+
+def extract_all(messages):
+    """
+    Extract AI text, tool calls and tool outputs from agent messages in one pass.
+
+    Args:
+        messages: The list of messages from the agent's response
+
+    Returns:
+        A tuple (ai_messages, tools_used, tool_messages)
+    """
+    ai_messages = []
     tools_used = []
-    
+    tool_messages = []
+
     for m in messages:
         if isinstance(m, AIMessage):
-            if hasattr(m, 'tool_calls') and m.tool_calls:
-                for tool_call in m.tool_calls:
-                    tool_name = tool_call['name']
-                    tool_args = tool_call['args']
-                    tools_used.append({
-                        'Tool Name': tool_name,
-                        'Tool Args': tool_args
-                    })
+            ai_messages.append({'AI Message': _content_texts(m.content)})
+
+            for tool_call in getattr(m, 'tool_calls', None) or ():
+                tools_used.append({
+                    'Tool Name': tool_call['name'],
+                    'Tool Args': tool_call['args']
+                })
         elif isinstance(m, ToolMessage):
             tool_content = {}
-            if hasattr(m, 'content'):
-                if isinstance(m.content, str):
-                    tool_content['Tool Content'] = m.content
-                elif isinstance(m.content, dict):
-                    tool_content.update(m.content)
-                elif isinstance(m.content, list):
-                    tool_content['Tool Content'] = m.content
+            content = getattr(m, 'content', None)
+            if isinstance(content, dict):
+                tool_content.update(content)
+            elif isinstance(content, (str, list)):
+                tool_content['Tool Content'] = content
             tool_messages.append(tool_content)
-    
+
+    return ai_messages, tools_used, tool_messages
+
+
+def extract_ai_messages(messages):
+    return extract_all(messages)[0]
+
+def extract_tool_messages(messages):
+    _, tools_used, tool_messages = extract_all(messages)
     return tools_used, tool_messages
 
 
-async def finalize_answer(model, messages, user_query):
+# Longest serialized tool output put into the refinement prompt; longer outputs
+# keep their head and tail
+MAX_TOOL_OUTPUT_CHARS = 4000
+
+_REFINEMENT_INSTRUCTIONS = """
+    Please provide a final, refined answer to the original question based on the tool outputs. 
+    Your answer should:
+    1. Be direct and address the question completely
+    2. Include relevant calculations or data from the tool outputs
+    3. Be well-structured and easy to understand
+    4. Provide any necessary context or explanation
+    5. Be conversational in tone while remaining informative
+    
+    FINAL ANSWER:
+    """
+
+
+def _truncate(text, limit=MAX_TOOL_OUTPUT_CHARS):
+    """Shorten text to about limit characters, keeping its head and tail."""
+    if len(text) <= limit:
+        return text
+    half = limit // 2
+    return f"{text[:half]} ...[{len(text) - 2 * half} characters omitted]... {text[-half:]}"
+
+
+def build_refinement_prompt(user_query, tools_used, tool_messages):
+    """
+    Build the prompt asking the model to refine the agent's answer.
+
+    Tool calls and outputs are written as JSON, one per line, into a single buffer;
+    each tool output is truncated to MAX_TOOL_OUTPUT_CHARS.
+
+    Args:
+        user_query: The original user question
+        tools_used: Tool calls as returned by extract_all
+        tool_messages: Tool outputs as returned by extract_all
+
+    Returns:
+        The prompt text
+    """
+    buf = io.StringIO()
+    write = buf.write
+    write("\n    You are an expert assistant that provides clear, concise, and well-structured answers.\n    \n")
+    write(f"    ORIGINAL QUESTION: {user_query}\n    \n    TOOLS USED:\n")
+    for tool in tools_used:
+        write("    ")
+        write(json.dumps(tool, ensure_ascii=False, default=str))
+        write("\n")
+    write("    \n    TOOL OUTPUTS: \n")
+    for tool_message in tool_messages:
+        write("    ")
+        write(_truncate(json.dumps(tool_message, ensure_ascii=False, default=str)))
+        write("\n")
+    write(_REFINEMENT_INSTRUCTIONS)
+    return buf.getvalue()
+
+
+async def finalize_answer(model, messages, user_query, extracted=None, stream=False):
     """
     Process the agent's raw output and generate a well-structured final answer.
     
@@ -98,61 +172,70 @@ async def finalize_answer(model, messages, user_query):
         model: The LLM model to use for refinement
         messages: The list of messages from the agent's response
         user_query: The original user question
+        extracted: Optional result of extract_all(messages), if the caller already has it
+        stream: Whether to write the answer to stdout as it is generated
         
     Returns:
         A refined, well-structured answer
     """
     # Extract relevant tool messages and outputs
-    tools_used, tool_messages = extract_tool_messages(messages)
+    _, tools_used, tool_messages = extracted or extract_all(messages)
     
     # Construct a prompt for the LLM to refine the answer
-    refinement_prompt = f"""
-    You are an expert assistant that provides clear, concise, and well-structured answers.
+    refinement_prompt = build_refinement_prompt(user_query, tools_used, tool_messages)
     
-    ORIGINAL QUESTION: {user_query}
-    
-    TOOLS USED:
-    {tools_used}
-    
-    TOOL OUTPUTS: 
-    {tool_messages}
-    
-    Please provide a final, refined answer to the original question based on the tool outputs. 
-    Your answer should:
-    1. Be direct and address the question completely
-    2. Include relevant calculations or data from the tool outputs
-    3. Be well-structured and easy to understand
-    4. Provide any necessary context or explanation
-    5. Be conversational in tone while remaining informative
-    
-    FINAL ANSWER:
-    """
+    if stream:
+        # Print tokens as they arrive instead of waiting for the whole answer
+        parts = []
+        async for chunk in model.astream([HumanMessage(content=refinement_prompt)]):
+            text = "".join(_content_texts(chunk.content))
+            if text:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+                parts.append(text)
+        sys.stdout.write("\n")
+        return "".join(parts)
     
     # Call the model to generate the refined answer
     refined_response = await model.ainvoke([HumanMessage(content=refinement_prompt)])
     
     # Extract the content from the model's response
     if isinstance(refined_response.content, list):
-        refined_answer = " ".join([item.get('text', '') for item in refined_response.content if isinstance(item, dict) and 'text' in item])
+        refined_answer = " ".join(_content_texts(refined_response.content))
     else:
         refined_answer = refined_response.content
         
     return refined_answer
 
 
+# Inputs that end the interactive session
+EXIT_COMMANDS = frozenset({'exit', 'quit', 'bye'})
+
+# MCP servers the agent connects to: name -> connect_to_server keyword arguments
+MCP_SERVERS = {
+    'math server': {'command': 'python', 'args': ['./MCP-SERVER/math_server.py']},
+    'web search': {'command': 'python', 'args': ['./MCP-SERVER/tavily_server.py']},
+}
+
+
 # Updated server function that incorporates the finalize_answer function
 async def server_with_refinement():
     async with MultiServerMCPClient() as client:
-        await client.connect_to_server('math server', command='python', args=['./MCP-SERVER/math_server.py'])
-        await client.connect_to_server('web search', command='python', args=['./MCP-SERVER/tavily_server.py'])
+        # Connect one at a time rather than with asyncio.gather: each stdio session
+        # opens an anyio task group, which has to be closed by the task that opened
+        # it, and the client closes them all from this task on exit
+        for name, params in MCP_SERVERS.items():
+            await client.connect_to_server(name, **params)
         
-        llm = call_model()
-        agent = create_react_agent(llm, client.get_tools())
+        agent = create_react_agent(model, client.get_tools())
         
         print("type exit to quit")
+        loop = asyncio.get_running_loop()
         while True:
-            user_query = input("\n enter your question: ")
-            if user_query.lower() in ['exit', 'quit', 'bye']:
+            # Read input in a worker thread so the event loop (and the MCP server
+            # sessions it drives) keeps running while waiting for the user
+            user_query = await loop.run_in_executor(None, input, "\n enter your question: ")
+            if user_query.lower() in EXIT_COMMANDS:
                 print('Exiting the MCP server')
                 break
             
@@ -165,7 +248,8 @@ async def server_with_refinement():
             messages = response['messages']
             
             print("---------------------- TOOL CALLS ----------------------")
-            tools_used, tool_messages = extract_tool_messages(messages)
+            extracted = extract_all(messages)
+            ai_messages, tools_used, tool_messages = extracted
             for tool in tools_used:
                 pprint(tool)
                 
@@ -174,18 +258,15 @@ async def server_with_refinement():
             #     pprint(tool_message)
 
             # print("\n---------------------- AI MESSAGES ----------------------")
-            # ai_messages = extract_ai_messages(messages)
             # for ai_message in ai_messages:
             #     pprint(ai_message)
             
             # Generate the refined final answer
             print("\n---------------------- REFINED FINAL ANSWER ----------------------")
-            final_answer = await finalize_answer(llm, messages, user_query)
-            print(final_answer)
+            await finalize_answer(model, messages, user_query, extracted, stream=True)
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(server_with_refinement())
 
 
@@ -0,0 +1,27 @@
+import importlib.util
+import anthropic
+import httpx
+
+
+# Keep-alive connection pool shared by all requests of a client; HTTP/2 when the
+# h2 package is installed. The SDK takes its timeout from a custom http_client,
+# so its default timeout is passed on explicitly.
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+HTTP2 = importlib.util.find_spec('h2') is not None
+
+
+def http_client():
+    """
+    Create a pooled HTTP client for a synchronous Anthropic client.
+    returns:
+        httpx.Client
+    """
+    return httpx.Client(http2=HTTP2, limits=HTTP_LIMITS, timeout=anthropic.DEFAULT_TIMEOUT)
+
+def async_http_client():
+    """
+    Create a pooled HTTP client for an AsyncAnthropic client.
+    returns:
+        httpx.AsyncClient
+    """
+    return httpx.AsyncClient(http2=HTTP2, limits=HTTP_LIMITS, timeout=anthropic.DEFAULT_TIMEOUT)
@@ -1,26 +1,75 @@
+import base64
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from anthropic import Anthropic 
+from http_pool import http_client
  
 
 load_dotenv()
 
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
+
+# Set LATENCY_MODE=optimized to answer with a faster vision model
+LATENCY_MODE = os.getenv('LATENCY_MODE', 'standard').strip().lower()
+DEFAULT_MODEL = 'claude-3-5-sonnet-20241022'
+LOW_LATENCY_MODEL = 'claude-3-haiku-20240307'
+INTERACTIVE_MODEL = LOW_LATENCY_MODEL if LATENCY_MODE == 'optimized' else DEFAULT_MODEL
  
  
-client = Anthropic(api_key=ANTHROPIC_API_KEY)
+client = Anthropic(
+    api_key=ANTHROPIC_API_KEY,
+    http_client=http_client()
+)
+
+# Bytes read per step when encoding an image; a multiple of 3 so each chunk
+# encodes to base64 without padding and the encoded chunks can be concatenated
+ENCODE_CHUNK_SIZE = 3 * 65536
+
+# Upper bound on the threads reading images at once; more only queue on the disk
+MAX_READ_WORKERS = 16
+
+# Number of encoded images kept for reuse. Each entry holds a whole base64
+# payload, so keep this small to bound the memory the cache pins.
+ENCODE_CACHE_SIZE = 8
+
+@functools.lru_cache(maxsize=ENCODE_CACHE_SIZE)
+def _encode_cached(image_path, mtime_ns, size):
+    """
+    Encode image to base64, cached by path, modification time and size.
+    The mtime and size are only part of the cache key, so a changed file is re-encoded.
+    """
+    # Encode in chunks so the whole raw file is never held in memory next to its encoding
+    encoded = bytearray()
+    with open(image_path, "rb") as image_file:
+        while chunk := image_file.read(ENCODE_CHUNK_SIZE):
+            encoded += base64.b64encode(chunk)
+    return encoded.decode('ascii')
 
 def encode_image(image_path):
     """
     Encode image to base64.
+    Repeated calls for an unchanged file return the cached encoding.
     Args:
         image_path: path to image file
     returns:
         base64 encoded image
     """
-    import base64
-    with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode('utf-8')
+    st = os.stat(image_path)
+    return _encode_cached(os.fspath(image_path), st.st_mtime_ns, st.st_size)
+
+def encode_images(image_paths):
+    """
+    Encode several images to base64 concurrently.
+    Args:
+        image_paths: paths to image files
+    returns:
+        base64 encoded images, in the same order as image_paths
+    """
+    # File reads and base64 encoding release the GIL, so threads overlap them
+    with ThreadPoolExecutor(max_workers=max(1, min(len(image_paths), MAX_READ_WORKERS))) as executor:
+        return list(executor.map(encode_image, image_paths))
 
 def build_image_comparison_message(image_path1, image_path2, question):
     """
@@ -32,6 +81,7 @@ def build_image_comparison_message(image_path1, image_path2, question):
     returns:
         Formatted message for the API
     """
+    image_data1, image_data2 = encode_images([image_path1, image_path2])
     return [
         {
             'role': 'user',
@@ -45,7 +95,7 @@ def build_image_comparison_message(image_path1, image_path2, question):
                     'source': {
                         'type': 'base64',
                         'media_type': 'image/jpeg',
-                        'data': encode_image(image_path1)
+                        'data': image_data1
                     }
                 },
                 {
@@ -53,7 +103,7 @@ def build_image_comparison_message(image_path1, image_path2, question):
                     'source': {
                         'type': 'base64',
                         'media_type': 'image/jpeg',
-                        'data': encode_image(image_path2)
+                        'data': image_data2
                     }
                 }
             ]
@@ -61,7 +111,7 @@ def build_image_comparison_message(image_path1, image_path2, question):
     ]
  
 
-def get_response(messages, model='claude-3-5-sonnet-20241022', max_tokens=1000):
+def get_response(messages, model=INTERACTIVE_MODEL, max_tokens=1000):
     """
     Get response from Claude API.
     Args:
@@ -1,14 +1,68 @@
+import csv
 import os
+import re
+import asyncio
 from dotenv import load_dotenv
-from anthropic import Anthropic
-import pandas as pd
+from anthropic import Anthropic, AsyncAnthropic
 import argparse
-from tqdm import tqdm
+from tqdm.asyncio import tqdm
+from http_pool import async_http_client, http_client
 
 load_dotenv()
 
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
-client = Anthropic(api_key=ANTHROPIC_API_KEY)
+
+# Set LATENCY_MODE=optimized to answer single questions with a faster model;
+# batch translation always uses DEFAULT_MODEL
+LATENCY_MODE = os.getenv('LATENCY_MODE', 'standard').strip().lower()
+DEFAULT_MODEL = 'claude-3-5-sonnet-20241022'
+LOW_LATENCY_MODEL = 'claude-3-5-haiku-20241022'
+INTERACTIVE_MODEL = LOW_LATENCY_MODEL if LATENCY_MODE == 'optimized' else DEFAULT_MODEL
+client = Anthropic(
+    api_key=ANTHROPIC_API_KEY,
+    http_client=http_client()
+)
+async_client = AsyncAnthropic(
+    api_key=ANTHROPIC_API_KEY,
+    http_client=async_http_client()
+)
+
+# Maximum number of requests sent to Claude at the same time in batch mode
+MAX_CONCURRENT_REQUESTS = 10
+
+# Number of questions translated per request in batch mode
+QUESTIONS_PER_REQUEST = 10
+
+# Most output tokens the model can return in one response
+MAX_OUTPUT_TOKENS = 8192
+
+# Schema used when none is given
+DEFAULT_SCHEMA = '\n'.join([
+    'CREATE TABLE Customers(customerID int, customerName text, city text);',
+    'CREATE TABLE Orders(orderID int, customerID int, orderDate date, totalAmount decimal);',
+    'CREATE TABLE Products(productID int, productName text, price decimal, category text);',
+    'CREATE TABLE OrderDetails(orderID int, productID int, quantity int);',
+])
+
+# Static prompt text between the schema and the question
+_PROMPT_INSTRUCTIONS = '\n'.join([
+    '\n# Instructions',
+    'Translate the following question into a valid SQL query based on the schema above.',
+    'Return only the SQL query without any explanations.',
+    '\n# Question',
+])
+
+# Static prompt text between the schema and the numbered questions in batch mode
+_BATCH_PROMPT_INSTRUCTIONS = '\n'.join([
+    '\n# Instructions',
+    'Translate each of the following numbered questions into a valid SQL query based on the schema above.',
+    'Answer with the same numbers, in the same order, each followed by its SQL query (for example "1. SELECT ...").',
+    'Return only the numbered SQL queries without any explanations.',
+    '\n# Questions',
+])
+
+# A numbered answer: its number and everything up to the next numbered line
+_NUMBERED_ANSWER = re.compile(r'^\s*(\d+)\.\s*(.+?)(?=^\s*\d+\.\s|\Z)', re.M | re.S)
 
 def create_prompt(question, schema=None):
     """
@@ -19,28 +73,9 @@ def create_prompt(question, schema=None):
     returns:
         Formatted prompt for the model
     """
-    parts = []
-    
-    # Add database schema information
-    parts.append('# Database Schema')
-    if schema:
-        parts.append(schema)
-    else:
-        parts.append('CREATE TABLE Customers(customerID int, customerName text, city text);')
-        parts.append('CREATE TABLE Orders(orderID int, customerID int, orderDate date, totalAmount decimal);')
-        parts.append('CREATE TABLE Products(productID int, productName text, price decimal, category text);')
-        parts.append('CREATE TABLE OrderDetails(orderID int, productID int, quantity int);')
-    
-    # Add instructions and question
-    parts.append('\n# Instructions')
-    parts.append('Translate the following question into a valid SQL query based on the schema above.')
-    parts.append('Return only the SQL query without any explanations.')
-    parts.append('\n# Question')
-    parts.append(question)
-    
-    return '\n'.join(parts)
+    return f"# Database Schema\n{schema or DEFAULT_SCHEMA}\n{_PROMPT_INSTRUCTIONS}\n{question}"
 
-def get_sql_translation(question, schema=None, model='claude-3-5-sonnet-20241022', max_tokens=1000):
+def get_sql_translation(question, schema=None, model=INTERACTIVE_MODEL, max_tokens=1000):
     """
     Translate natural language question to SQL using Claude.
     Args:
@@ -65,6 +100,117 @@ def get_sql_translation(question, schema=None, model='claude-3-5-sonnet-20241022
         print(f"Error with API request: {e}")
         return None
 
+async def get_sql_translation_async(question, schema=None, model=DEFAULT_MODEL, max_tokens=1000):
+    """
+    Translate natural language question to SQL using Claude, without blocking the event loop.
+    Args:
+        question: Natural language question
+        schema: Optional database schema
+        model: Model to use
+        max_tokens: Maximum tokens in response
+    returns:
+        SQL query
+    """
+    prompt = create_prompt(question, schema)
+    
+    try:
+        response = await async_client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[{'role': 'user', 'content': prompt}]
+        )
+        sql_query = response.content[0].text.strip()
+        return sql_query
+    except Exception as e:
+        print(f"Error with API request: {e}")
+        return None
+
+async def translate_questions(
+    questions,
+    schema=None,
+    max_concurrency=MAX_CONCURRENT_REQUESTS,
+    batch_size=QUESTIONS_PER_REQUEST
+):
+    """
+    Translate several questions to SQL, batch_size questions per request, with
+    the requests sent concurrently.
+    Questions missing from a batch response are retried one at a time.
+    Args:
+        questions: Natural language questions
+        schema: Optional database schema
+        max_concurrency: Maximum number of requests in flight at once
+        batch_size: Number of questions per request
+    returns:
+        SQL queries, in the same order as the questions
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def bounded_batch(batch):
+        async with semaphore:
+            sql_queries = await get_sql_translations_async(batch, schema)
+        # Fall back to single-question requests for anything the batch missed
+        for index, sql_query in enumerate(sql_queries):
+            if sql_query is None:
+                async with semaphore:
+                    sql_queries[index] = await get_sql_translation_async(batch[index], schema)
+        return sql_queries
+    
+    batches = [questions[i:i + batch_size] for i in range(0, len(questions), batch_size)]
+    results = await tqdm.gather(*(bounded_batch(batch) for batch in batches), desc="Translating question batches")
+    return [sql_query for batch_results in results for sql_query in batch_results]
+
+def create_batch_prompt(questions, schema=None):
+    """
+    Create a prompt for translating several questions to SQL in one request.
+    Args:
+        questions: Natural language questions to translate to SQL
+        schema: Optional database schema information
+    returns:
+        Formatted prompt for the model, with the questions numbered from 1
+    """
+    numbered = '\n'.join(f"{number}. {question}" for number, question in enumerate(questions, 1))
+    return f"# Database Schema\n{schema or DEFAULT_SCHEMA}\n{_BATCH_PROMPT_INSTRUCTIONS}\n{numbered}"
+
+def parse_numbered_answers(text, count):
+    """
+    Parse a numbered list of SQL queries from a batch response.
+    Args:
+        text: Model response
+        count: Number of questions in the batch
+    returns:
+        List of count SQL queries, with None for any number missing from the response
+    """
+    answers = [None] * count
+    for number, sql_query in _NUMBERED_ANSWER.findall(text.replace('```sql', '').replace('```', '')):
+        index = int(number) - 1
+        if 0 <= index < count and answers[index] is None:
+            answers[index] = sql_query.strip()
+    return answers
+
+async def get_sql_translations_async(questions, schema=None, model=DEFAULT_MODEL, max_tokens_per_question=1000):
+    """
+    Translate several natural language questions to SQL with a single Claude request.
+    Args:
+        questions: Natural language questions
+        schema: Optional database schema
+        model: Model to use
+        max_tokens_per_question: Response token budget per question
+    returns:
+        SQL queries in the same order as the questions, with None for any not translated
+    """
+    prompt = create_batch_prompt(questions, schema)
+    
+    try:
+        response = await async_client.messages.create(
+            model=model,
+            max_tokens=min(MAX_OUTPUT_TOKENS, max_tokens_per_question * len(questions)),
+            messages=[{'role': 'user', 'content': prompt}]
+        )
+    except Exception as e:
+        print(f"Error with API request: {e}")
+        return [None] * len(questions)
+    return parse_numbered_answers(response.content[0].text if response.content else '', len(questions))
+
 def load_schema_from_file(file_path):
     """
     Load database schema from a file.
@@ -97,15 +243,14 @@ def batch_process_questions(questions_file, output_file, schema_file=None):
     with open(questions_file, 'r') as file:
         questions = [line.strip() for line in file if line.strip()]
     
-    # Process questions
-    results = []
-    for question in tqdm(questions, desc="Translating questions"):
-        sql_query = get_sql_translation(question, schema)
-        results.append({"question": question, "sql_query": sql_query})
+    # Process questions concurrently
+    sql_queries = asyncio.run(translate_questions(questions, schema))
     
-    # Save results
-    df = pd.DataFrame(results)
-    df.to_csv(output_file, index=False)
+    # Save results, one row per question
+    with open(output_file, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file, lineterminator=os.linesep)
+        writer.writerow(['question', 'sql_query'])
+        writer.writerows(zip(questions, sql_queries))
     print(f"Results saved to {output_file}")
 
 if __name__ == '__main__':
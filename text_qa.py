@@ -1,21 +1,82 @@
 import os
+import asyncio
 from dotenv import load_dotenv
-from anthropic import Anthropic 
+import anthropic
+from anthropic import AsyncAnthropic
 import pandas as pd
 import argparse
-from tqdm import tqdm 
+from tqdm.asyncio import tqdm
+from http_pool import async_http_client
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 load_dotenv()
 
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
  
  
-client = Anthropic(api_key=ANTHROPIC_API_KEY)
+# Retries are done by create_message, so the SDK's own retries are turned off
+client = AsyncAnthropic(
+    api_key=ANTHROPIC_API_KEY,
+    max_retries=0,
+    http_client=async_http_client()
+)
 file_path = './text/reviews.csv'
 
+# Maximum number of batches sent to Claude at the same time
+MAX_CONCURRENT_REQUESTS = 8
+
+# The only column of the reviews CSV that is used
+REVIEW_COLUMN = 'Review Body'
+
+# Static part of the sentiment prompt, followed by the reviews of each batch
+SENTIMENT_INSTRUCTIONS = (
+    "Below are customer reviews. Please analyze the sentiment of each review "
+    "and categorize it as Positive, Negative, or Neutral. Then, provide a summary in percentages: "
+    "1. Total number of reviews "
+    "2. Number of Positive reviews and their percentage (%) "
+    "3. Number of Negative reviews and their percentage (%) "
+    "4. Number of Neutral reviews and their percentage (%)\n\n"
+    "Additionally, please provide the final metrics showing the percentage breakdown for each category "
+    "in a clear and concise format.\n\n"
+    "The reviews are separated by lines containing only ---."
+)
+
+# Separator placed between the reviews of a batch in the prompt
+REVIEW_SEPARATOR = "\n---\n"
+
  
 
-def analyze_sentiment(reviews):
+# Statuses below 500 that are worth retrying: request timeout, conflict and rate limit
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+def is_transient_error(error):
+    """
+    Check whether a failed API request is worth retrying.
+    Matches the errors the SDK itself retries: the statuses above, any 5xx
+    (including 529 overloaded) and connection failures or timeouts.
+    """
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500
+    return False
+
+# Transient errors are retried with jittered exponential backoff instead of
+# losing the batch. Other errors, such as invalid requests, fail at once.
+@retry(
+    wait=wait_exponential_jitter(initial=1, max=30),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception(is_transient_error),
+    reraise=True
+)
+async def create_message(messages):
+    return await client.messages.create(
+        model='claude-3-5-sonnet-20241022',
+        max_tokens = 1000,
+        messages=messages
+    )
+
+async def analyze_sentiment(reviews):
     """
     Process the CSV file in chunks to avoid token limits
     
@@ -26,42 +87,59 @@ def analyze_sentiment(reviews):
     Returns:
         Summary of sentiment analysis
     """
-    prompt = (
-        "Below are customer reviews. Please analyze the sentiment of each review "
-        "and categorize it as Positive, Negative, or Neutral. Then, provide a summary in percentages: "
-        "1. Total number of reviews "
-        "2. Number of Positive reviews and their percentage (%) "
-        "3. Number of Negative reviews and their percentage (%) "
-        "4. Number of Neutral reviews and their percentage (%)\n\n"
-        "Additionally, please provide the final metrics showing the percentage breakdown for each category "
-        "in a clear and concise format.\n\n"
-        f"Reviews: {reviews}"
-    )
+    # Join the reviews as plain text rather than formatting the list's repr,
+    # which quotes and escapes every review
+    joined_reviews = REVIEW_SEPARATOR.join(map(str, reviews))
+    prompt = f"{SENTIMENT_INSTRUCTIONS}\n\nReviews:\n{joined_reviews}"
     
     print("Sending data to claude for the analysis")
  
     try:
-        response = client.messages.create(
-            model='claude-3-5-sonnet-20241022',
-            max_tokens = 1000,
-            messages=[
-                {
-                    'role': 'user',
-                    'content': prompt
-                }
-            ]
-        )
+        response = await create_message([
+            {
+                'role': 'user',
+                'content': prompt
+            }
+        ])
         return response.content[0].text if response.content else "No reponse found"        
     except Exception as e:
         print(f"Error with API request: {e}")
         
-def process_csv(file_path, chunk_size=20):
+def iter_review_batches(file_path, chunk_size):
+    """
+    Read the review column of a CSV file one batch at a time.
+    
+    The file is never loaded as a whole, and the first batches can be sent
+    before the rest of it is parsed.
+    
+    Args:
+        file_path (str): Path to the CSV file.
+        chunk_size (int): Number of reviews per batch.
+    
+    Yields:
+        Lists of at most chunk_size reviews.
+    
+    Raises:
+        ValueError: If the file has no REVIEW_COLUMN column.
+    """
+    with pd.read_csv(
+        file_path,
+        usecols=[REVIEW_COLUMN],
+        dtype={REVIEW_COLUMN: 'string'},
+        chunksize=chunk_size
+    ) as reader:
+        for batch_df in reader:
+            yield batch_df[REVIEW_COLUMN].tolist()
+        
+async def process_csv(file_path, chunk_size=20, max_concurrency=MAX_CONCURRENT_REQUESTS):
     """
      Reads a CSV file in chunks, sends reviews to Claude for sentiment analysis.
+     Batches are analyzed concurrently, at most max_concurrency at a time.
     
     Args:
         file_path (str): Path to the CSV file.
         chunk_size (int): Number of reviews to process per batch to avoid token limits.
+        max_concurrency (int): Maximum number of requests in flight at once.
     
     """
     
@@ -70,18 +148,43 @@ def process_csv(file_path, chunk_size=20):
         return
     
     try:
-        df = pd.read_csv(file_path)
-        if 'Review Body' not in df.columns:
-            print("Error: CSV file must contain a 'Review Body' column")
+        # Check the header up front, so a missing column is not confused with
+        # the ValueErrors pandas raises for malformed rows
+        if REVIEW_COLUMN not in pd.read_csv(file_path, nrows=0).columns:
+            print(f"Error: CSV file must contain a '{REVIEW_COLUMN}' column")
             return
-        total_reviews = len(df)
-        print(f"Processing {total_reviews} reviews in chunks of {chunk_size}")
         
-        all_results = []
-        for i in tqdm(range(0, total_reviews, chunk_size), desc="processing batches" ):
-            batch_reviews = df['Review Body'][i:i+chunk_size].tolist()
-            result = analyze_sentiment(batch_reviews)
-            all_results.append(result)
+        print(f"Processing reviews in chunks of {chunk_size}")
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def analyze_and_release(batch_reviews):
+            try:
+                return await analyze_sentiment(batch_reviews)
+            finally:
+                semaphore.release()
+        
+        # Start each batch's request as soon as it is parsed. Acquiring the semaphore
+        # before parsing the next batch keeps at most max_concurrency batches in memory.
+        tasks = []
+        total_reviews = 0
+        try:
+            for batch_reviews in iter_review_batches(file_path, chunk_size):
+                total_reviews += len(batch_reviews)
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(analyze_and_release(batch_reviews)))
+                # Yield so the new request is sent while the next batch is parsed
+                await asyncio.sleep(0)
+        except Exception:
+            # Don't leave requests for earlier batches running; the error itself
+            # is reported below
+            for task in tasks:
+                task.cancel()
+            raise
+        print(f"Read {total_reviews} reviews in {len(tasks)} batches")
+        
+        # gather returns the results in batch order
+        all_results = await tqdm.gather(*tasks, desc="processing batches")
         
         print("\=== SENTIMENT ANALYSIS RESULT")
         for res in all_results:
@@ -94,6 +197,6 @@ def process_csv(file_path, chunk_size=20):
     
 if __name__ == '__main__':
      
-    process_csv(file_path)
+    asyncio.run(process_csv(file_path))
 
  
\ No newline at end of file